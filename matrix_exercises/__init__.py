@@ -0,0 +1,91 @@
+# =========================
+# Matrix exercises package
+# =========================
+# The eleven exercises and the tools built around them, split into small
+# modules. Nothing is imported here: every public name is loaded from its
+# module the first time it is used (PEP 562 module __getattr__), so
+# 'import matrix_exercises' is almost free and a script that only needs
+# sum_row never pays for the server, NumPy or the storage helpers.
+#
+#   from matrix_exercises import sum_row       # loads only .operations
+#   matrix_exercises.exercise_9()              # loads .exercises.exercise_9
+
+import importlib
+
+# Module (relative to this package) -> public names it provides
+_MODULE_EXPORTS = {
+    "utils": ("parse_integer", "ask_integer", "parse_integers", "parse_integer_rows",
+              "format_integer_errors", "ask_integers", "run_questions",
+              "capture_output", "print_matrix",
+              "create_matrix", "optional_numpy", "numpy_sum_dtype"),
+    "operations": ("sum_row", "sum_column", "sum_main_diagonal",
+                   "sum_secondary_diagonal", "matrix_average"),
+    "exercises.exercise_1": ("exercise_1",),
+    "exercises.exercise_2": ("exercise_2",),
+    "exercises.exercise_3": ("exercise_3",),
+    "exercises.exercise_4": ("exercise_4", "exercise_4_steps", "print_exercise_4_menu"),
+    "exercises.exercise_5": ("exercise_5",),
+    "exercises.exercise_6": ("exercise_6",),
+    "exercises.exercise_7": ("exercise_7", "exercise_7_steps", "has_winner", "board_full",
+                             "print_board"),
+    "exercises.exercise_8": ("exercise_8",),
+    "exercises.exercise_9": ("exercise_9", "selection_sort"),
+    "exercises.exercise_10": ("exercise_10",),
+    "exercises.exercise_11": ("exercise_11",),
+    "menu": ("main_menu", "print_main_menu"),
+    "order_statistics": ("matrix_top_k", "matrix_bottom_k", "quickselect",
+                         "matrix_percentile", "matrix_median", "ReservoirSample",
+                         "streaming_percentiles"),
+    "histogram": ("ValueHistogram",),
+    "views": ("VectorView", "MatrixView"),
+    "reshape": ("flatten", "reshape", "reshape_matrix", "transpose",
+                "transpose_in_place"),
+    "unique": ("FeistelPermutation", "unique_random_values", "unique_random_rows",
+               "unique_random_matrix", "UNIQUE_SAMPLING_METHODS"),
+    "groupby": ("GroupBy",),
+    "chunked": ("chunk_rows", "read_text_chunks", "write_binary_matrix",
+                "read_binary_chunks", "summarize_chunks", "chunked_sum_row",
+                "chunked_sum_column", "chunked_sum_main_diagonal",
+                "chunked_sum_secondary_diagonal", "chunked_matrix_average"),
+    "cache": ("cache_key", "ResultCache", "default_cache", "seeded_random",
+              "run_exercise_cached", "cached_random_matrix"),
+    "parallel": ("parallel_random_matrix", "gil_disabled"),
+    "masks": ("Predicate", "Mask", "equals", "between", "greater_than", "less_than",
+              "is_even", "is_odd", "where"),
+    "survey": ("SURVEY_FIELDS", "SurveyRecordError", "validate_record",
+               "iter_survey_records", "SurveyReport", "ingest_survey"),
+    "boards": ("WINNING_LINES", "NO_WINNER", "X_WINS", "O_WINS", "BOTH_WIN",
+               "encode_board", "decode_board", "pack_boards", "board_code",
+               "code_to_board", "batch_winners", "code_winners", "board_winner"),
+    "extremes": ("ExtremeTracker",),
+    "windows": ("sliding_sums", "sliding_averages", "sliding_max", "sliding_min",
+                "SummedAreaTable"),
+    "linalg": ("LUDecomposition", "lu_decompose", "determinant", "solve_linear",
+               "inverse"),
+    "sharded": ("ShardError", "Shard", "serve_shard", "launch_shard_workers",
+                "ShardedMatrix"),
+    "footprint": ("deep_sizeof", "measure_representations", "format_footprint_table"),
+    "server": ("SessionClosed", "ExerciseSession", "handle_client",
+               "start_exercise_server", "serve_exercises", "run_scripted_client"),
+}
+
+# Public name -> module, built once from the table above
+_EXPORTS = {name: module
+            for module, names in _MODULE_EXPORTS.items()
+            for name in names}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    """Imports the module that defines 'name' on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Next accesses don't go through __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,27 @@
+# =========================
+# Entry point
+# =========================
+# python -m matrix_exercises                -> console menu
+# python -m matrix_exercises --serve [port] -> network server
+# Only the modules needed by the chosen mode are imported.
+
+import sys
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "--serve":
+        import asyncio
+        from .server import serve_exercises
+        port = int(argv[1]) if len(argv) > 1 else 8765
+        try:
+            asyncio.run(serve_exercises(port=port))
+        except KeyboardInterrupt:
+            print("Server stopped.")
+    else:
+        from .menu import main_menu
+        main_menu()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import itertools
+
+from .utils import optional_numpy
+
+# =========================
+# Compact tic-tac-toe boards (batch evaluation)
+# =========================
+# Exercise 7 keeps one board as nested lists of 'X', 'O' and '-' and
+# has_winner checks it cell by cell. To analyse many games at once, boards
+# are stored compactly instead:
+#
+# - Packed bytes: 9 bytes per board (one uint8 per cell, row-major),
+#   with 0 = '-', 1 = 'X', 2 = 'O'. Thousands of boards fit in one buffer.
+# - Base-3 code: one int in [0, 3**9) per board (cell 0 is the most
+#   significant digit), looked up in a precomputed table of all 19683 boards.
+#
+# batch_winners never loops over boards in Python: for every cell it takes
+# the slice data[cell::9] (that cell in all the boards), turns it into one
+# big int with a 1 byte where the cell holds the mark, and ANDs/ORs those
+# ints along the 8 WINNING_LINES. With NumPy the same is done on a
+# (boards x 9) uint8 array.
+#
+# Result per board (one byte): NO_WINNER, X_WINS, O_WINS or BOTH_WIN (the
+# last one cannot happen in a real game, it flags an impossible board).
+
+MARKS = "-XO"               # Cell code -> mark
+CELL_CODES = {mark: code for code, mark in enumerate(MARKS)}
+BOARD_CELLS = 9
+
+NO_WINNER, X_WINS, O_WINS, BOTH_WIN = 0, 1, 2, 3
+
+# Flat cell indices (i*3 + j) of the 3 rows, 3 columns and 2 diagonals
+WINNING_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+# bytes.translate tables: cell code -> 1 if it holds that mark, else 0
+_HOLDS_X = bytes.maketrans(b"\x00\x01\x02", b"\x00\x01\x00")
+_HOLDS_O = bytes.maketrans(b"\x00\x01\x02", b"\x00\x00\x01")
+
+_code_table = None  # Winner of every base-3 code, built on first use
+
+
+def encode_board(board):
+    """Packs a 3x3 board of 'X', 'O', '-' into 9 bytes."""
+    try:
+        data = bytes(CELL_CODES[mark] for row in board for mark in row)
+    except KeyError as error:
+        raise ValueError(f"invalid mark {error.args[0]!r}: use 'X', 'O' or '-'") from None
+    if len(data) != BOARD_CELLS:
+        raise ValueError("a board must have 3 rows of 3 cells")
+    return data
+
+
+def decode_board(data):
+    """Unpacks 9 bytes into a 3x3 board of 'X', 'O', '-' (nested lists)."""
+    if len(data) != BOARD_CELLS:
+        raise ValueError("a packed board has exactly 9 bytes")
+    return [[MARKS[code] for code in data[i:i + 3]] for i in range(0, BOARD_CELLS, 3)]
+
+
+def pack_boards(boards):
+    """Packs an iterable of 3x3 boards into one bytes buffer (9 bytes each)."""
+    return b"".join(encode_board(board) for board in boards)
+
+
+def board_code(board):
+    """Base-3 code of a board (nested lists or 9 packed bytes)."""
+    data = board if isinstance(board, (bytes, bytearray)) else encode_board(board)
+    code = 0
+    for cell in data:
+        code = code * 3 + cell
+    return code
+
+
+def code_to_board(code):
+    """Inverse of board_code: returns the board as 9 packed bytes."""
+    if not 0 <= code < 3 ** BOARD_CELLS:
+        raise ValueError("a board code must be in [0, 3**9)")
+    cells = bytearray(BOARD_CELLS)
+    for k in range(BOARD_CELLS - 1, -1, -1):
+        code, cells[k] = divmod(code, 3)
+    return bytes(cells)
+
+
+def _check_packed(data):
+    """Returns data as bytes and the number of boards, validating it."""
+    data = bytes(data)
+    count, extra = divmod(len(data), BOARD_CELLS)
+    if extra:
+        raise ValueError("packed boards must have a multiple of 9 bytes")
+    # Deleting the valid codes must leave nothing behind
+    if data.translate(None, b"\x00\x01\x02"):
+        raise ValueError("packed cells must be 0 ('-'), 1 ('X') or 2 ('O')")
+    return data, count
+
+
+def batch_winners(data, use_numpy=None):
+    """
+    Winner of every board in a packed buffer, as bytes (one per board) with
+    values NO_WINNER, X_WINS, O_WINS or BOTH_WIN.
+
+    - use_numpy: see optional_numpy.
+    - result.count(X_WINS) etc. give the totals directly.
+    """
+    data, count = _check_packed(data)
+    np = optional_numpy(use_numpy)
+    if not count:
+        return b""
+    if np is not None:
+        cells = np.frombuffer(data, dtype=np.uint8).reshape(count, BOARD_CELLS)
+        lines = cells[:, WINNING_LINES]  # boards x 8 lines x 3 cells
+        x_wins = (lines == 1).all(axis=2).any(axis=1)
+        o_wins = (lines == 2).all(axis=2).any(axis=1)
+        return (x_wins.astype(np.uint8) | (o_wins.astype(np.uint8) << 1)).tobytes()
+
+    columns = [data[cell::BOARD_CELLS] for cell in range(BOARD_CELLS)]
+    result = 0
+    for shift, table in ((0, _HOLDS_X), (1, _HOLDS_O)):
+        # Byte k of holds[cell] is 1 if board k has the mark in that cell
+        holds = [int.from_bytes(column.translate(table), "little") for column in columns]
+        won = 0
+        for a, b, c in WINNING_LINES:
+            won |= holds[a] & holds[b] & holds[c]
+        result |= won << shift
+    return result.to_bytes(count, "little")
+
+
+def code_winners(codes):
+    """
+    Winner of every board given by its base-3 code, as bytes (one per
+    board), using the precomputed table of all 3**9 boards.
+    """
+    global _code_table
+    if _code_table is None:
+        every_board = bytes(itertools.chain.from_iterable(
+            itertools.product(range(3), repeat=BOARD_CELLS)))  # In code order
+        _code_table = batch_winners(every_board, use_numpy=False)
+    codes = list(codes)
+    if codes and (min(codes) < 0 or max(codes) >= len(_code_table)):
+        raise ValueError("a board code must be in [0, 3**9)")
+    return bytes(map(_code_table.__getitem__, codes))
+
+
+def board_winner(board):
+    """Winner of a single board (nested lists, 9 bytes or base-3 code)."""
+    if isinstance(board, int):
+        return code_winners((board,))[0]
+    data = board if isinstance(board, (bytes, bytearray)) else encode_board(board)
+    return batch_winners(data, use_numpy=False)[0]
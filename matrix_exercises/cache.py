@@ -0,0 +1,197 @@
+import collections
+import contextlib
+import hashlib
+import io
+import json
+import os
+import pickle
+import random
+
+from .exercises import load_exercise
+from .utils import capture_output
+
+# =========================
+# Result cache for seeded runs
+# =========================
+# Running the same exercise with the same parameters and the same seed
+# always produces the same matrices and the same output. ResultCache stores
+# those results under a key computed from (exercise, parameters, seed,
+# backend), so repeated benchmark or grading runs return immediately.
+#
+# - In memory: least recently used entries are evicted when the cache holds
+#   more than max_entries results or more than max_bytes (pickled size).
+# - On disk (optional): every result is also written to directory/<key>.pickle
+#   and read back on a memory miss, so the cache survives between processes.
+
+_MISSING = object()  # Sentinel: "not in the cache" (None is a valid result)
+
+
+def cache_key(name, parameters=(), seed=None, backend="python"):
+    """
+    Content-addressed key: SHA-256 of the canonical JSON of the inputs.
+    - parameters may be a tuple/list or a dict; values must be JSON-friendly.
+    """
+    payload = json.dumps([name, parameters, seed, backend], sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    LRU cache of computed results with size limits and optional disk storage.
+
+    - max_entries: maximum number of results kept in memory.
+    - max_bytes: maximum total pickled size in memory (None = no limit).
+    - directory: folder for the disk copy (None = memory only).
+    - hits/misses count the lookups, to check the cache is useful.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None, directory=None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.entries = collections.OrderedDict()  # key -> (value, size)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries or (
+            self.directory is not None and os.path.exists(self._path(key)))
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def get(self, key, default=None):
+        """Returns the cached value (marking it as recently used) or default."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        if self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as file:
+                    data = file.read()
+            except FileNotFoundError:
+                pass
+            else:
+                value = pickle.loads(data)
+                self._store(key, value, len(data))
+                self.hits += 1
+                return value
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """Stores value in memory (and on disk if a directory was given)."""
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.directory is not None:
+            # Write to a temporary name and rename: readers never see half a file
+            temporary = self._path(key) + f".{os.getpid()}.tmp"
+            with open(temporary, "wb") as file:
+                file.write(data)
+            os.replace(temporary, self._path(key))
+        self._store(key, value, len(data))
+
+    def _store(self, key, value, size):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[1]
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # Too big for memory (it may still be on disk)
+        self.entries[key] = (value, size)
+        self.total_bytes += size
+        # Evict least recently used entries until both limits are respected
+        while len(self.entries) > self.max_entries or (
+                self.max_bytes is not None and self.total_bytes > self.max_bytes):
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+
+    def get_or_compute(self, key, compute):
+        """Returns the cached value for key, computing and storing it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self, disk=False):
+        """Empties the memory cache (and the disk copy if disk=True)."""
+        self.entries.clear()
+        self.total_bytes = 0
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pickle"):
+                    os.remove(os.path.join(self.directory, name))
+
+
+default_cache = ResultCache()
+
+
+@contextlib.contextmanager
+def seeded_random(seed):
+    """
+    Seeds the global 'random' generator used by the exercises and restores
+    its previous state afterwards, so seeded runs don't disturb other code.
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+# Exercises 4 and 7 are interactive menus/games: their output depends on
+# every answer, so they cannot be replayed from a cache.
+_NOT_CACHEABLE = {4, 7}
+
+
+def run_exercise_cached(number, *args, seed=None, cache=None, backend="python"):
+    """
+    Runs exercise 'number' with the given arguments and seed and returns
+    everything it printed, reusing the cached output when possible.
+
+    - Exercises that ask questions need their answers as arguments,
+      e.g. run_exercise_cached(3, 2000, seed=1) for exercise_3 with n=2000.
+    - seed=None means "not reproducible": the result is not cached.
+    - backend is part of the key, so runs with different backends
+      (e.g. "python" and "numpy") never share results.
+    """
+    if number in _NOT_CACHEABLE:
+        raise ValueError(f"exercise {number} is interactive and cannot be cached")
+    exercise = load_exercise(number)
+
+    def compute():
+        buffer = io.StringIO()
+        with seeded_random(seed), capture_output(buffer):
+            exercise(*args)
+        return buffer.getvalue()
+
+    if seed is None:
+        return compute()
+    cache = default_cache if cache is None else cache
+    return cache.get_or_compute(cache_key(f"exercise_{number}", args, seed, backend), compute)
+
+
+def cached_random_matrix(rows, columns, low, high, seed, cache=None):
+    """
+    Returns a rows x columns matrix of random integers in [low, high]
+    generated with its own random.Random(seed), cached by its parameters.
+    - The cached matrix is shared: copy it before modifying it.
+    """
+    cache = default_cache if cache is None else cache
+
+    def compute():
+        rng = random.Random(seed)
+        return [[rng.randint(low, high) for _ in range(columns)] for _ in range(rows)]
+
+    key = cache_key("random_matrix", (rows, columns, low, high), seed)
+    return cache.get_or_compute(key, compute)
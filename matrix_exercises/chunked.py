@@ -0,0 +1,189 @@
+import array
+import itertools
+import mmap
+import os
+
+from .utils import numpy_sum_dtype, optional_numpy
+from .views import MatrixView
+
+# =========================
+# Out-of-core reductions (row chunks)
+# =========================
+# sum_row, sum_column, sum_main_diagonal, sum_secondary_diagonal and
+# matrix_average need the whole matrix in memory. The versions below consume
+# the matrix as a stream of row chunks (from a text file, a binary file
+# read through mmap, or any generator) and keep only O(columns) state, so the
+# memory used depends on the chunk size, not on the matrix size.
+#
+# - A "chunk" is a list of rows; a chunk stream is any iterable of chunks.
+# - chunk_rows() groups a plain row iterator into chunks.
+# - Results are the same as the in-memory helpers.
+
+def chunk_rows(rows, chunk_size=1024):
+    """Groups any iterable of rows into lists of at most chunk_size rows."""
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_text_chunks(path, chunk_size=1024, delimiter=None, convert=int):
+    """
+    Reads a text matrix (one row per line) in chunks of rows.
+    - delimiter=None splits on whitespace; use "," for CSV files.
+    - convert turns every field into a number (int by default).
+    - Blank lines are ignored.
+    """
+    def rows():
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield [convert(field) for field in line.split(delimiter)]
+    return chunk_rows(rows(), chunk_size)
+
+
+def write_binary_matrix(path, rows, typecode="q"):
+    """
+    Writes rows (any iterable, e.g. a generator) to a raw binary file of
+    fixed-size numbers. Returns (rows, columns) of the written matrix.
+    """
+    count = columns = 0
+    with open(path, "wb") as file:
+        for row in rows:
+            values = array.array(typecode, row)
+            if count == 0:
+                columns = len(values)
+            elif len(values) != columns:
+                raise ValueError("all rows must have the same length")
+            values.tofile(file)
+            count += 1
+    return count, columns
+
+
+def read_binary_chunks(path, columns, typecode="q", chunk_size=1024):
+    """
+    Reads a raw binary matrix written by write_binary_matrix through mmap.
+    - Each chunk is copied into a small array.array and yielded as a
+      MatrixView, so memory stays at chunk_size*columns numbers.
+    - The operating system pages the file in and out as needed.
+    """
+    itemsize = array.array(typecode).itemsize
+    row_bytes = columns * itemsize
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return  # mmap cannot map empty files
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(mapped) % row_bytes:
+                raise ValueError("file size is not a multiple of the row size")
+            for start in range(0, len(mapped), chunk_size * row_bytes):
+                block = array.array(typecode)
+                block.frombytes(mapped[start:start + chunk_size * row_bytes])
+                yield MatrixView(block, len(block) // columns, columns)
+
+
+def summarize_chunks(chunks, rows=()):
+    """
+    Computes in ONE pass over a chunk stream:
+      - column sums, main and secondary diagonal sums,
+      - total, number of cells and average,
+      - the sums of the row indices listed in 'rows'.
+    State is O(columns + len(rows)). The secondary diagonal uses the number
+    of columns as n (the matrix is assumed square, as in exercise 4).
+    Uses NumPy for the per-chunk sums when it is installed.
+    """
+    np = optional_numpy()
+    wanted = set(rows)
+    row_sums = {}
+    column_sums = None
+    main_diagonal = secondary_diagonal = 0
+    row_count = columns = 0
+
+    for chunk in chunks:
+        if np is not None:
+            if isinstance(chunk, MatrixView) and isinstance(chunk.buffer, array.array):
+                block = np.asarray(chunk.as_memoryview())  # Shares the chunk memory
+            else:
+                block = np.asarray(chunk)
+            if block.size == 0:
+                continue
+            if block.ndim != 2 or (column_sums is not None and block.shape[1] != columns):
+                raise ValueError("all rows must have the same length")
+            if column_sums is None:
+                columns = block.shape[1]
+                column_sums = [0] * columns
+            dtype = numpy_sum_dtype(np, block)
+            if dtype is object:
+                block = block.astype(object)  # int64 sums could wrap: exact Python ints
+            column_sums = [a + b for a, b in
+                           zip(column_sums, block.sum(axis=0, dtype=dtype).tolist())]
+            for offset, row_total in enumerate(block.sum(axis=1, dtype=dtype).tolist()):
+                if row_count + offset in wanted:
+                    row_sums[row_count + offset] = row_total
+            first, last = row_count, min(row_count + len(block), columns)
+            if first < last:
+                positions = np.arange(first, last)
+                main_diagonal += sum(block[positions - first, positions].tolist())
+                secondary_diagonal += sum(block[positions - first, columns - 1 - positions].tolist())
+            row_count += len(block)
+            continue
+
+        for row in chunk:
+            if column_sums is None:
+                columns = len(row)
+                column_sums = [0] * columns
+            elif len(row) != columns:
+                raise ValueError("all rows must have the same length")
+            row_total = 0
+            for j, value in enumerate(row):
+                column_sums[j] += value
+                row_total += value
+            if row_count in wanted:
+                row_sums[row_count] = row_total
+            if row_count < columns:
+                main_diagonal += row[row_count]
+                secondary_diagonal += row[columns - 1 - row_count]
+            row_count += 1
+
+    column_sums = column_sums or []
+    total = sum(column_sums)
+    elements = row_count * columns
+    missing = wanted - row_sums.keys()
+    if missing:
+        raise IndexError(f"row index out of range: {min(missing)}")
+    return {
+        "rows": row_count,
+        "columns": columns,
+        "total": total,
+        "average": total / elements if elements > 0 else 0,
+        "column_sums": column_sums,
+        "main_diagonal": main_diagonal,
+        "secondary_diagonal": secondary_diagonal,
+        "row_sums": row_sums,
+    }
+
+
+def chunked_sum_row(chunks, idx):
+    """Out-of-core version of sum_row."""
+    return summarize_chunks(chunks, rows=(idx,))["row_sums"][idx]
+
+
+def chunked_sum_column(chunks, idx):
+    """Out-of-core version of sum_column."""
+    return summarize_chunks(chunks)["column_sums"][idx]
+
+
+def chunked_sum_main_diagonal(chunks):
+    """Out-of-core version of sum_main_diagonal."""
+    return summarize_chunks(chunks)["main_diagonal"]
+
+
+def chunked_sum_secondary_diagonal(chunks):
+    """Out-of-core version of sum_secondary_diagonal (square matrices)."""
+    return summarize_chunks(chunks)["secondary_diagonal"]
+
+
+def chunked_matrix_average(chunks):
+    """Out-of-core version of matrix_average."""
+    return summarize_chunks(chunks)["average"]
@@ -0,0 +1,21 @@
+# =========================
+# Exercises
+# =========================
+# One module per exercise (exercise_1.py ... exercise_11.py). They are
+# imported on demand by load_exercise, so the menu starts without loading
+# the code of exercises that are never chosen.
+
+import importlib
+
+EXERCISE_COUNT = 11
+
+
+def load_exercise(number):
+    """
+    Returns the function of exercise 'number' (1..11), importing its module
+    the first time it is requested.
+    """
+    if not 1 <= number <= EXERCISE_COUNT:
+        raise ValueError(f"exercise number must be between 1 and {EXERCISE_COUNT}")
+    module = importlib.import_module(f".exercise_{number}", __name__)
+    return getattr(module, f"exercise_{number}")
@@ -0,0 +1,23 @@
+from ..utils import print_matrix
+
+# =========================
+# Exercise 1
+# =========================
+
+def exercise_1():
+    """
+    Creates a 3x3 matrix with numbers from 1 to 9 and prints it.
+    - Maintain a counter that increments to fill the matrix.
+    - Build row by row and finally print with print_matrix.
+    """
+    matrix = []
+    counter = 1  # First number to insert
+    for _ in range(3):          # Repeat 3 times for the 3 rows
+        row = []
+        for _ in range(3):      # Repeat 3 times for the 3 columns
+            row.append(counter)  # Insert counter into the row
+            counter += 1         # Increment the counter
+        matrix.append(row)     # Add the complete row to the matrix
+
+    print("3x3 matrix with numbers from 1 to 9:")
+    print_matrix(matrix)       # Show the matrix in readable format
@@ -0,0 +1,36 @@
+from ..extremes import ExtremeTracker
+from ..utils import ask_integers, print_matrix
+
+# =========================
+# Exercise 10
+# =========================
+
+def exercise_10(matrix=None):
+    """
+    Reads a 5x4 matrix (20 integers) from keyboard, prints it, and shows:
+      - Maximum and its positions.
+      - Minimum and its positions.
+    - Each row is typed on one line and validated at once with ask_integers
+      (every wrong value of the line is reported together).
+    - If matrix is given, nothing is read from the keyboard.
+    """
+    rows, columns = 5, 4
+    if matrix is None:
+        matrix = []
+        print(f"Enter {rows * columns} integers for a {rows}x{columns} matrix (one row per line):")
+        for i in range(rows):
+            matrix.append(ask_integers(f"Row {i} ({columns} integers): ", count=columns))
+
+    print("Read matrix:")
+    print_matrix(matrix)
+
+    # The tracker indexes the matrix once: max/min come from the roots of its
+    # segment trees and their positions from its value -> cells index (it
+    # also stays correct if cells are changed later with tracker.set)
+    tracker = ExtremeTracker(matrix)
+    maximum, minimum = tracker.maximum(), tracker.minimum()
+    max_positions = tracker.max_positions()
+    min_positions = tracker.min_positions()
+
+    print(f"Maximum: {maximum}, positions: {max_positions}")
+    print(f"Minimum: {minimum}, positions: {min_positions}")
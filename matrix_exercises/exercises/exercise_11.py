@@ -0,0 +1,31 @@
+import random
+
+from ..utils import ask_integer
+
+# =========================
+# Exercise 11
+# =========================
+
+def exercise_11(column_counts=None):
+    """
+    Creates an irregular matrix (rows with different number of columns).
+    - User specifies how many rows (>=2).
+    - For each row, user specifies how many columns (>=1).
+    - Each cell is filled with a random integer between 1 and 5.
+    - Prints the matrix and the length of each row to clarify the irregularity.
+    - column_counts (list with the columns of each row) skips the questions.
+    """
+    if column_counts is None:
+        rows = ask_integer("Number of rows (>=2): ", minimum=2)
+        column_counts = [
+            ask_integer(f"Number of columns in row {i} (>=1): ", minimum=1)
+            for i in range(rows)
+        ]
+    matrix = []
+    for cols in column_counts:
+        row = [random.randint(1, 5) for _ in range(cols)]
+        matrix.append(row)
+
+    print("Generated irregular matrix:")
+    for i, row in enumerate(matrix):
+        print(f"Row {i} ({len(row)} col): {row}")
@@ -0,0 +1,22 @@
+import random
+
+from ..utils import ask_integer, print_matrix
+
+# =========================
+# Exercise 2
+# =========================
+
+def exercise_2(n=None):
+    """
+    Creates a matrix with 5 rows and n columns (n entered by user).
+    - Fills with random numbers between 0 and 10 inclusive.
+    - Uses list comprehension to create the matrix compactly.
+    - If n is given, it is not asked (used by the network sessions).
+    """
+    if n is None:
+        n = ask_integer("Number of columns (n): ", minimum=1)  # Validate n>=1
+    # Creation: for each of the 5 rows generate n random numbers
+    matrix = [[random.randint(0, 10) for _ in range(n)] for _ in range(5)]
+
+    print("5 x n matrix with random numbers between 0 and 10:")
+    print_matrix(matrix)
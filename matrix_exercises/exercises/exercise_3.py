@@ -0,0 +1,34 @@
+import random
+
+from ..parallel import parallel_random_matrix
+from ..utils import ask_integer, print_matrix
+
+# =========================
+# Exercise 3
+# =========================
+
+def exercise_3(n=None):
+    """
+    Creates two square matrices A and B of size n x n (n entered by user),
+    with random values, and calculates their element-wise sum in C.
+
+    - A and B are matrices with numbers [0..9].
+    - C[i][j] = A[i][j] + B[i][j].
+    - Prints A, B, and C.
+    - If n is given, it is not asked.
+    """
+    if n is None:
+        n = ask_integer("Size n for n x n matrices: ", minimum=1)
+    # Generate A and B in parallel blocks of rows (serially if n is small).
+    # The seeds come from 'random', so random.seed() still reproduces the run.
+    A = parallel_random_matrix(n, n, 0, 9, seed=random.getrandbits(64))
+    B = parallel_random_matrix(n, n, 0, 9, seed=random.getrandbits(64))
+    # Build C by summing element-wise, row by row
+    C = [[a + b for a, b in zip(row_a, row_b)] for row_a, row_b in zip(A, B)]
+
+    print("Matrix A:")
+    print_matrix(A)
+    print("Matrix B:")
+    print_matrix(B)
+    print("Sum C = A + B:")
+    print_matrix(C)
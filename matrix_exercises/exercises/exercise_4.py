@@ -0,0 +1,81 @@
+import random
+
+from ..operations import (
+    matrix_average,
+    sum_column,
+    sum_main_diagonal,
+    sum_row,
+    sum_secondary_diagonal,
+)
+from ..utils import ask_integer, create_matrix, print_matrix, run_questions
+
+# =========================
+# Exercise 4
+# =========================
+
+def print_exercise_4_menu():
+    """Prints the options of the exercise 4 menu."""
+    print("Menu (4x4 matrix):")
+    print("1. Fill ENTIRE matrix with random numbers")
+    print("2. Sum a row")
+    print("3. Sum a column")
+    print("4. Sum main diagonal")
+    print("5. Sum secondary diagonal")
+    print("6. Average of all values")
+    print("0. Exit")
+
+
+def exercise_4_steps():
+    """
+    Implements a menu to operate on a 4x4 matrix.
+    Important restriction:
+      - Operations (2..6) cannot be executed until the matrix
+        has been filled by option 1.
+    - Option 1 fills the matrix with random values and sets 'filled=True'.
+    - The menu loop repeats until the user chooses to exit (0).
+    - Questions are yielded as (message, minimum, maximum) and the answer is
+      received back (see run_questions), so the console and the network
+      sessions share this loop.
+    """
+    n = 4
+    matrix = create_matrix(n, n, 0)  # Initialize matrix with zeros to have structure
+    filled = False  # Flag indicating if the matrix has been filled
+
+    while True:
+        print_exercise_4_menu()
+        option = yield "Choose an option: ", 0, 6
+
+        if option == 0:
+            break  # Exit the menu loop and the function
+
+        if option == 1:
+            # Fill the matrix with random values between 0 and 20
+            matrix = [[random.randint(0, 20) for _ in range(n)] for _ in range(n)]
+            filled = True
+            print("Matrix filled:")
+            print_matrix(matrix)
+            continue  # Return to start of loop to show menu
+
+        # If matrix hasn't been filled yet, options 2..6 shouldn't execute
+        if not filled:
+            print("You must fill the matrix first (option 1).")
+            continue
+
+        # From here, filled == True, we can execute operations
+        if option == 2:
+            idx = yield f"Row index [0..{n-1}]: ", 0, n - 1
+            print(f"Sum of row {idx}: {sum_row(matrix, idx)}")
+        elif option == 3:
+            idx = yield f"Column index [0..{n-1}]: ", 0, n - 1
+            print(f"Sum of column {idx}: {sum_column(matrix, idx)}")
+        elif option == 4:
+            print(f"Main diagonal sum: {sum_main_diagonal(matrix)}")
+        elif option == 5:
+            print(f"Secondary diagonal sum: {sum_secondary_diagonal(matrix)}")
+        elif option == 6:
+            print(f"Matrix average: {matrix_average(matrix):.3f}")
+
+
+def exercise_4(ask=ask_integer):
+    """Exercise 4 menu; ask answers the questions (keyboard by default)."""
+    run_questions(exercise_4_steps(), ask)
@@ -0,0 +1,22 @@
+import random
+
+from ..utils import print_matrix
+from ..views import MatrixView
+
+# =========================
+# Exercise 5
+# =========================
+
+def exercise_5():
+    """
+    Generates a 3x3 matrix with non-repeating random numbers.
+    Instead of trying to generate unique numbers randomly (which can be
+    inefficient), we build the list [1..9], shuffle it, and place it row by row.
+    """
+    numbers = list(range(1, 10))  # List with numbers 1 to 9
+    random.shuffle(numbers)       # Shuffle the list in place
+    # Read the list as 3 rows of 3 elements (a view: nothing is copied)
+    matrix = MatrixView(numbers, 3, 3)
+
+    print("3x3 matrix without repeats:")
+    print_matrix(matrix)
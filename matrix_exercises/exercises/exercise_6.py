@@ -0,0 +1,37 @@
+import random
+
+from ..operations import sum_column, sum_row
+from ..utils import ask_integer, print_matrix
+
+# =========================
+# Exercise 6
+# =========================
+
+def exercise_6(rows=None, columns=None):
+    """
+    Generates a matrix of size rows x columns with random numbers.
+    Then RANDOMLY chooses whether to sum a row or a column, and which index to use.
+    - Choosing row or column is done with random.choice([True, False]).
+    - Shows the result and which random choice was made.
+    - rows/columns are asked only if not given.
+    """
+    if rows is None:
+        rows = ask_integer("Number of rows: ", minimum=1)
+    if columns is None:
+        columns = ask_integer("Number of columns: ", minimum=1)
+    matrix = [[random.randint(0, 9) for _ in range(columns)] for _ in range(rows)]
+    print("Generated matrix:")
+    print_matrix(matrix)
+
+    # Random decision: True -> row, False -> column
+    choose_row = random.choice([True, False])
+    if choose_row:
+        # Choose a random row index within valid range
+        idx = random.randint(0, rows - 1)
+        total = sum_row(matrix, idx)
+        print(f"RANDOMLY chose ROW {idx}. Sum = {total}")
+    else:
+        # Choose a random column index within valid range
+        idx = random.randint(0, columns - 1)
+        total = sum_column(matrix, idx)
+        print(f"RANDOMLY chose COLUMN {idx}. Sum = {total}")
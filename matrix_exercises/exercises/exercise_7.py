@@ -0,0 +1,86 @@
+from ..utils import ask_integer, run_questions
+
+# =========================
+# Exercise 7 (Tic-tac-toe)
+# =========================
+
+def has_winner(board, mark):
+    """
+    Checks if the player with 'mark' (e.g., 'X' or 'O') has won.
+    - Checks all rows: if any entire row contains the mark, there's a winner.
+    - Checks all columns: same logic as rows.
+    - Checks both diagonals.
+    Returns True if there's a victory, False otherwise.
+    """
+    # Check rows and columns
+    for i in range(3):
+        if all(board[i][j] == mark for j in range(3)):  # row i complete
+            return True
+        if all(board[j][i] == mark for j in range(3)):  # column i complete
+            return True
+    # Main diagonal
+    if all(board[i][i] == mark for i in range(3)):
+        return True
+    # Secondary diagonal
+    if all(board[i][2 - i] == mark for i in range(3)):
+        return True
+    return False
+
+def board_full(board):
+    """
+    Returns True if there are no empty positions ('-') on the board.
+    - Uses a comprehension that traverses all rows and all characters.
+    """
+    return all(c != '-' for row in board for c in row)
+
+def print_board(board):
+    """Simple and clear printing of the 3x3 board for the game."""
+    for row in board:
+        print(" ".join(row))
+    print()
+
+def exercise_7_steps():
+    """
+    Tic-tac-toe game for two human players:
+    - initial board with '-' indicating empty cell.
+    - current_player alternates between 'X' and 'O'.
+    - Validates that the chosen position is within range and is empty.
+    - After placing the mark, checks if there's a winner or if the board is full.
+    - Questions are yielded to the driver (see run_questions).
+    """
+    board = [['-' for _ in range(3)] for _ in range(3)]
+    current_player = 'X'
+
+    while True:
+        print(f"Player {current_player}'s turn:")
+        print_board(board)
+
+        # Ask for validated row and column (0..2)
+        row = yield "Row [0..2]: ", 0, 2
+        col = yield "Column [0..2]: ", 0, 2
+
+        # Check if the cell is free
+        if board[row][col] != '-':
+            print("Position occupied. Choose another.")
+            continue  # Ask for another position
+
+        # Place the mark
+        board[row][col] = current_player
+
+        # Check game state: victory or tie
+        if has_winner(board, current_player):
+            print_board(board)
+            print(f"{current_player} wins!")
+            break
+
+        if board_full(board):
+            print_board(board)
+            print("Tie: no more positions.")
+            break
+
+        # Alternate player
+        current_player = 'O' if current_player == 'X' else 'X'
+
+def exercise_7(ask=ask_integer):
+    """Tic-tac-toe; ask answers the questions (keyboard by default)."""
+    run_questions(exercise_7_steps(), ask)
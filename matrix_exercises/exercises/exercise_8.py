@@ -0,0 +1,49 @@
+import random
+
+from ..groupby import GroupBy
+
+# =========================
+# Exercise 8 (Survey)
+# =========================
+
+def exercise_8():
+    """
+    Simulates a survey of 10 people with fields:
+      - gender: 1=male, 2=female
+      - works: 1=yes, 2=no
+      - salary: if works, number between 600 and 2000; if not, 0
+    Calculates percentages and average salaries by group.
+    - Data is randomly generated to simplify the demonstration.
+    - All statistics come from a single GroupBy pass over the columns.
+    """
+    n = 10
+    survey = []
+    for _ in range(n):
+        gender = random.randint(1, 2)
+        works = random.randint(1, 2)
+        salary = random.randint(600, 2000) if works == 1 else 0
+        survey.append((gender, works, salary))
+
+    # Group by (gender, works) in one pass; the gender-only totals are a rollup
+    genders, works_column, salaries = zip(*survey)  # rows -> columns
+    groups = GroupBy.from_columns({"gender": genders, "works": works_column},
+                                  {"salary": salaries})
+    by_gender = groups.rollup("gender")
+
+    pct_males = by_gender.percentage((1,))
+    pct_females = by_gender.percentage((2,))
+    pct_males_working = groups.percentage((1, 1))
+    pct_females_working = groups.percentage((2, 1))
+
+    avg_males = groups.mean((1, 1), "salary")
+    avg_females = groups.mean((2, 1), "salary")
+
+    # Output results with readable format
+    print("Generated data (gender, works, salary):")
+    print(survey)
+    print(f"Percentage of males: {pct_males:.1f}%")
+    print(f"Percentage of females: {pct_females:.1f}%")
+    print(f"Percentage of males who work: {pct_males_working:.1f}%")
+    print(f"Percentage of females who work: {pct_females_working:.1f}%")
+    print(f"Average salary of males who work: {avg_males:.2f}")
+    print(f"Average salary of females who work: {avg_females:.2f}")
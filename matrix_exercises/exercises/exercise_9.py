@@ -0,0 +1,79 @@
+import random
+
+from ..histogram import ValueHistogram
+from ..masks import is_even
+from ..operations import sum_main_diagonal
+from ..order_statistics import matrix_median, matrix_top_k
+from ..reshape import flatten
+from ..utils import print_matrix
+from ..views import MatrixView
+
+# =========================
+# Exercise 9
+# =========================
+
+def selection_sort(lst):
+    """
+    Selection sort algorithm on a list in place.
+    - Didactic purpose: explain how an O(n^2) algorithm works.
+    - Not the most efficient method for large lists (use .sort() or sorted()).
+    """
+    n = len(lst)
+    for i in range(n - 1):
+        min_idx = i
+        # Find the minimum in the unsorted part
+        for j in range(i + 1, n):
+            if lst[j] < lst[min_idx]:
+                min_idx = j
+        # If we found a minimum different from i, swap
+        if min_idx != i:
+            lst[i], lst[min_idx] = lst[min_idx], lst[i]
+
+
+def exercise_9():
+    """
+    Creates a 5x5 matrix with random numbers (0..99) and performs:
+      - Average of all elements.
+      - Determine the maximum and how many times it appears.
+      - Show all even numbers.
+      - Sum main diagonal.
+      - Sum the last row.
+      - Sort all elements and reconstruct a sorted matrix.
+    """
+    n = 5
+    matrix = [[random.randint(0, 99) for _ in range(n)] for _ in range(n)]
+    print("Original 5x5 matrix:")
+    print_matrix(matrix)
+
+    # Calculate average
+    total = sum(sum(row) for row in matrix)
+    average = total / (n * n)
+    print(f"Matrix average: {average:.3f}")
+
+    # Find maximum and number of repetitions with a one-pass value histogram
+    flat = list(flatten(matrix))  # convert to flat list (sorted later)
+    histogram = ValueHistogram.from_matrix(matrix, 0, 99)
+    maximum, repetitions = histogram.max_count()
+    print(f"Maximum number: {maximum}, appears {repetitions} times")
+
+    # Median and top 3 without sorting the whole matrix
+    print(f"Median: {matrix_median(matrix)}")
+    print(f"Top 3 values: {matrix_top_k(matrix, 3)}")
+
+    # Extract even numbers with a parity mask (one bit per cell)
+    even_numbers = is_even().evaluate(matrix).values(matrix)
+    print(f"Even numbers ({len(even_numbers)}): {even_numbers}")
+
+    # Sum main diagonal
+    main_diag = sum_main_diagonal(matrix)
+    print(f"Main diagonal sum: {main_diag}")
+
+    # Sum of last row (index -1)
+    last_row_sum = sum(matrix[-1])
+    print(f"Sum of last row: {last_row_sum}")
+
+    # Sorting: sort the flat list and read it as n rows (view, no copy)
+    selection_sort(flat)
+    sorted_matrix = MatrixView(flat, n, n)
+    print("Matrix sorted in ascending order:")
+    print_matrix(sorted_matrix)
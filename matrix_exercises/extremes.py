@@ -0,0 +1,184 @@
+import collections
+
+# =========================
+# Dynamic min/max tracker (2D segment tree)
+# =========================
+# Exercise 10 finds the maximum, the minimum and their positions by scanning
+# the whole matrix, so after changing one cell everything must be scanned
+# again. ExtremeTracker keeps the answers up to date instead:
+#
+# - Two 2D segment trees (one for min, one for max): the outer tree is over
+#   the rows and every outer node holds an inner tree over the columns.
+#   A point update touches O(log rows * log columns) nodes and the min/max
+#   of any rectangular region is combined from O(log rows * log columns)
+#   nodes. The global min/max is the root: O(1).
+# - An index value -> set of (i, j) cells gives the positions of any value
+#   (so of the min/max) without scanning.
+#
+# Regions are half-open like Python slices: rows [top, bottom) and
+# columns [left, right).
+
+
+def _build(leaf_rows, columns, combine):
+    """
+    Iterative (bottom-up) 2D segment tree as a list of 2*rows lists of
+    2*columns values. Leaves are tree[rows + i][columns + j].
+    """
+    rows = len(leaf_rows)
+    tree = [None] * (2 * rows)
+    for i, values in enumerate(leaf_rows):
+        row = [None] * columns + list(values)
+        for c in range(columns - 1, 0, -1):
+            row[c] = combine(row[2 * c], row[2 * c + 1])
+        tree[rows + i] = row
+    for r in range(rows - 1, 0, -1):
+        # map() combines the two children element by element in C
+        # (index 0 of every inner tree is unused)
+        tree[r] = [None, *map(combine, tree[2 * r][1:], tree[2 * r + 1][1:])]
+    return tree
+
+
+def _update(tree, rows, columns, i, j, value, combine):
+    """Sets leaf (i, j) and recomputes its ancestors in both dimensions."""
+    r = rows + i
+    row = tree[r]
+    c = columns + j
+    row[c] = value
+    c >>= 1
+    while c:
+        row[c] = combine(row[2 * c], row[2 * c + 1])
+        c >>= 1
+    r >>= 1
+    while r:
+        upper, first, second = tree[r], tree[2 * r], tree[2 * r + 1]
+        c = columns + j
+        while c:
+            upper[c] = combine(first[c], second[c])
+            c >>= 1
+        r >>= 1
+
+
+def _query(tree, rows, columns, top, bottom, left, right, combine):
+    """Combines the values of the region rows [top, bottom) x columns [left, right)."""
+    nodes = []  # Outer nodes (inner trees) that exactly cover the rows
+    top += rows
+    bottom += rows
+    while top < bottom:
+        if top & 1:
+            nodes.append(tree[top])
+            top += 1
+        if bottom & 1:
+            bottom -= 1
+            nodes.append(tree[bottom])
+        top >>= 1
+        bottom >>= 1
+    values = []
+    for row in nodes:
+        low, high = left + columns, right + columns
+        while low < high:
+            if low & 1:
+                values.append(row[low])
+                low += 1
+            if high & 1:
+                high -= 1
+                values.append(row[high])
+            low >>= 1
+            high >>= 1
+    return combine(values)
+
+
+class ExtremeTracker:
+    """
+    Minimum and maximum of a matrix (globally or in any rectangular region)
+    and their positions, kept up to date under cell updates.
+
+    - set(i, j, value) / tracker[i, j] = value: O(log rows * log columns).
+    - maximum() / minimum(): O(1).
+    - max_positions() / min_positions(): O(k log k) for k positions.
+    - region_max / region_min: O(log rows * log columns).
+    - The tracker keeps its own copy of the values: write through it.
+    """
+
+    def __init__(self, matrix):
+        self.rows = len(matrix)
+        self.columns = len(matrix[0]) if self.rows else 0
+        if not self.rows or not self.columns:
+            raise ValueError("the matrix must have at least one cell")
+        values = [list(row) for row in matrix]
+        if any(len(row) != self.columns for row in values):
+            raise ValueError("the matrix must be rectangular")
+        self._min_tree = _build(values, self.columns, min)
+        self._max_tree = _build(values, self.columns, max)
+        self.cells = collections.defaultdict(set)  # value -> {(i, j), ...}
+        for i, row in enumerate(values):
+            for j, value in enumerate(row):
+                self.cells[value].add((i, j))
+
+    def __getitem__(self, position):
+        i, j = position
+        self._check(i, j)
+        return self._max_tree[self.rows + i][self.columns + j]
+
+    def __setitem__(self, position, value):
+        self.set(*position, value)
+
+    def _check(self, i, j):
+        if not (0 <= i < self.rows and 0 <= j < self.columns):
+            raise IndexError(f"cell ({i}, {j}) outside the {self.rows}x{self.columns} matrix")
+
+    def set(self, i, j, value):
+        """Writes value in cell (i, j) and updates both trees and the index."""
+        old = self[i, j]
+        if old == value:
+            return
+        positions = self.cells[old]
+        positions.discard((i, j))
+        if not positions:
+            del self.cells[old]
+        self.cells[value].add((i, j))
+        _update(self._min_tree, self.rows, self.columns, i, j, value, min)
+        _update(self._max_tree, self.rows, self.columns, i, j, value, max)
+
+    def to_lists(self):
+        """Current values as a list of lists."""
+        return [row[self.columns:] for row in self._max_tree[self.rows:]]
+
+    def maximum(self):
+        return self._max_tree[1][1]  # Root of both dimensions
+
+    def minimum(self):
+        return self._min_tree[1][1]
+
+    def positions_of(self, value):
+        """Sorted (row-major) list of the cells holding value."""
+        return sorted(self.cells.get(value, ()))
+
+    def max_positions(self):
+        return self.positions_of(self.maximum())
+
+    def min_positions(self):
+        return self.positions_of(self.minimum())
+
+    def _region(self, top, bottom, left, right):
+        """Validates a region (None = up to the edge) and returns its bounds."""
+        bottom = self.rows if bottom is None else bottom
+        right = self.columns if right is None else right
+        if not (0 <= top < bottom <= self.rows and 0 <= left < right <= self.columns):
+            raise ValueError("the region must be a non-empty part of the matrix")
+        return top, bottom, left, right
+
+    def region_max(self, top=0, bottom=None, left=0, right=None):
+        """Maximum of rows [top, bottom) x columns [left, right)."""
+        region = self._region(top, bottom, left, right)
+        return _query(self._max_tree, self.rows, self.columns, *region, max)
+
+    def region_min(self, top=0, bottom=None, left=0, right=None):
+        """Minimum of rows [top, bottom) x columns [left, right)."""
+        region = self._region(top, bottom, left, right)
+        return _query(self._min_tree, self.rows, self.columns, *region, min)
+
+    def region_positions(self, value, top=0, bottom=None, left=0, right=None):
+        """Sorted cells of the region holding value (e.g. its max or min)."""
+        top, bottom, left, right = self._region(top, bottom, left, right)
+        return sorted((i, j) for i, j in self.cells.get(value, ())
+                      if top <= i < bottom and left <= j < right)
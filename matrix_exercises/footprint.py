@@ -0,0 +1,244 @@
+import argparse
+import array
+import json
+import random
+import sys
+import tracemalloc
+
+from .utils import optional_numpy
+from .views import MatrixView
+
+# =========================
+# Memory footprint of matrix representations
+# =========================
+# create_matrix returns a list of lists: every row is a list of pointers and
+# every value outside -5..256 is its own int object, so a "small" matrix can
+# use several times more memory than its numbers need. This module builds
+# the same random matrix in several representations and measures each one:
+#
+# - deep_bytes: sys.getsizeof of the object and everything it references
+#   (shared objects, e.g. the cached small ints, are counted once).
+# - traced_bytes / traced_peak_bytes: what tracemalloc saw allocated while
+#   building it (retained at the end / highest point during the build).
+#
+# Representations: list of lists (or jagged rows like exercise 11), one
+# array.array with the smallest integer type (MatrixView), a sparse dict
+# {row-major index: value} that only stores non-zero cells, and a NumPy
+# array when NumPy is installed. The cheapest one is recommended.
+#
+#   python -m matrix_exercises.footprint 1000 1000 --low 0 --high 99
+#   python -m matrix_exercises.footprint 500 500 --density 0.01 --json
+
+# (typecode, bytes) candidates for array-backed storage, smallest first
+_INTEGER_TYPECODES = (("b", 1), ("h", 2), ("i", 4), ("q", 8))
+
+
+def deep_sizeof(obj):
+    """
+    Bytes used by obj and every object reachable from it (containers,
+    instance attributes, NumPy bases), each object counted once.
+    """
+    seen = set()
+    total = 0
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, bytearray, array.array, int, float)):
+            continue  # No references to other objects
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        elif isinstance(current, memoryview):
+            pending.append(current.obj)
+        elif hasattr(current, "nbytes") and hasattr(current, "base"):
+            if current.base is not None:  # NumPy view: the data lives in its base
+                pending.append(current.base)
+        elif hasattr(current, "__dict__"):
+            pending.append(vars(current))
+    return total
+
+
+def _smallest_typecode(low, high):
+    """Smallest signed array typecode able to hold every value in [low, high]."""
+    for typecode, size in _INTEGER_TYPECODES:
+        limit = 2 ** (8 * size - 1)
+        if -limit <= low and high < limit and array.array(typecode).itemsize == size:
+            return typecode
+    raise ValueError("values do not fit in a 64-bit integer")
+
+
+def _row_lengths(rows, columns, jagged, rng):
+    """Columns of every row: all equal, or 1..columns like exercise 11."""
+    if jagged:
+        return [rng.randint(1, columns) for _ in range(rows)]
+    return [columns] * rows
+
+
+def _values(spec):
+    """Row-by-row generator of the random values of the workload (same every call)."""
+    rng = random.Random(spec["seed"])
+    lengths = _row_lengths(spec["rows"], spec["columns"], spec["jagged"], rng)
+    low, high, density = spec["low"], spec["high"], spec["density"]
+    for length in lengths:
+        yield [rng.randint(low, high) if rng.random() < density else 0 for _ in range(length)]
+
+
+def _build_lists(spec):
+    return list(_values(spec))
+
+
+def _build_array(spec):
+    typecode = _smallest_typecode(min(spec["low"], 0), max(spec["high"], 0))
+    values = array.array(typecode)
+    offsets = array.array("q", [0])  # Start of every row (for jagged rows)
+    for row in _values(spec):
+        values.extend(row)
+        offsets.append(len(values))
+    if spec["jagged"]:
+        return values, offsets
+    return MatrixView(values, spec["rows"], spec["columns"])
+
+
+def _build_sparse(spec):
+    cells = {}
+    index = 0
+    for row in _values(spec):
+        for value in row:
+            if value:
+                cells[index] = value
+            index += 1
+    return cells
+
+
+def _build_numpy(spec):
+    np = optional_numpy()
+    typecode = _smallest_typecode(min(spec["low"], 0), max(spec["high"], 0))
+    matrix = np.zeros((spec["rows"], spec["columns"]), dtype=np.dtype(typecode))
+    for i, row in enumerate(_values(spec)):
+        matrix[i] = row
+    return matrix
+
+
+def _representations(jagged):
+    """[(name, description, builder)] that apply to the workload."""
+    result = [
+        ("jagged" if jagged else "list_of_lists",
+         "list of row lists of int objects" + (" (exercise 11 style)" if jagged else ""),
+         _build_lists),
+        ("array", "one array.array of the smallest integer type"
+                  + (" + row offsets" if jagged else " (MatrixView)"), _build_array),
+        ("sparse", "dict {row-major index: value} of the non-zero cells", _build_sparse),
+    ]
+    if not jagged and optional_numpy() is not None:
+        result.append(("numpy", "NumPy array of the smallest integer dtype", _build_numpy))
+    return result
+
+
+def measure_representations(rows, columns, low=0, high=99, density=1.0, jagged=False, seed=0):
+    """
+    Builds a rows x columns matrix of random integers in [low, high] in
+    every representation and returns a report dict (JSON-friendly).
+
+    - density: fraction of non-zero cells (the rest are 0).
+    - jagged: rows of 1..columns values instead of a rectangle.
+    - report["recommended"] is the representation with the fewest deep_bytes.
+    """
+    if rows < 1 or columns < 1:
+        raise ValueError("rows and columns must be >= 1")
+    if high < low:
+        raise ValueError("high must be >= low")
+    if not 0 <= density <= 1:
+        raise ValueError("density must be between 0 and 1")
+    spec = {"rows": rows, "columns": columns, "low": low, "high": high,
+            "density": density, "jagged": jagged, "seed": seed}
+    cells = sum(_row_lengths(rows, columns, jagged, random.Random(seed)))
+
+    results = []
+    for name, description, build in _representations(jagged):
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        matrix = build(spec)
+        current, peak = tracemalloc.get_traced_memory()
+        if not was_tracing:
+            tracemalloc.stop()
+        deep = deep_sizeof(matrix)
+        del matrix
+        results.append({
+            "name": name,
+            "description": description,
+            "deep_bytes": deep,
+            "bytes_per_cell": deep / cells,
+            "traced_bytes": current - before,
+            "traced_peak_bytes": peak - before,
+        })
+
+    best = min(results, key=lambda result: result["deep_bytes"])
+    baseline = results[0]["deep_bytes"]
+    for result in results:
+        result["vs_lists"] = result["deep_bytes"] / baseline
+    return dict(spec, cells=cells, representations=results, recommended=best["name"])
+
+
+def _format_bytes(count):
+    for unit in ("B", "KiB", "MiB"):
+        if abs(count) < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GiB"
+
+
+def format_footprint_table(report):
+    """Text table of a measure_representations report, with the recommendation."""
+    if report["jagged"]:
+        shape = f"{report['rows']} jagged rows of 1..{report['columns']} values"
+    else:
+        shape = f"{report['rows']} x {report['columns']}"
+    lines = [
+        f"Matrix: {shape}, {report['cells']} cells, values in"
+        f" [{report['low']}, {report['high']}], density {report['density']:g}",
+        f"{'representation':<15} {'deep size':>12} {'B/cell':>8} {'traced':>12}"
+        f" {'build peak':>12} {'vs lists':>9}",
+    ]
+    for result in report["representations"]:
+        lines.append(
+            f"{result['name']:<15} {_format_bytes(result['deep_bytes']):>12}"
+            f" {result['bytes_per_cell']:>8.2f} {_format_bytes(result['traced_bytes']):>12}"
+            f" {_format_bytes(result['traced_peak_bytes']):>12} {result['vs_lists']:>8.2f}x")
+    best = next(result for result in report["representations"]
+                if result["name"] == report["recommended"])
+    lines.append(f"Recommended: {best['name']} ({best['description']})")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m matrix_exercises.footprint",
+        description="Compares the memory used by several matrix representations.")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("columns", type=int)
+    parser.add_argument("--low", type=int, default=0)
+    parser.add_argument("--high", type=int, default=99)
+    parser.add_argument("--density", type=float, default=1.0,
+                        help="fraction of non-zero cells (default 1)")
+    parser.add_argument("--jagged", action="store_true",
+                        help="rows of 1..columns values (exercise 11 style)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    report = measure_representations(args.rows, args.columns, args.low, args.high,
+                                     args.density, args.jagged, args.seed)
+    print(json.dumps(report, indent=2) if args.json else format_footprint_table(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
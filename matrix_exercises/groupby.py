@@ -0,0 +1,328 @@
+import math
+import random
+import sys
+
+from .utils import optional_numpy
+
+# =========================
+# Group-by engine for surveys
+# =========================
+# Exercise 8 computes every statistic with its own comprehension, so each
+# metric is another pass over the data. GroupBy reads the data ONCE and keeps,
+# for every combination of categorical keys, the count plus the sum, the sum
+# of squared deviations from the mean (M2), minimum and maximum of each
+# numeric column. Everything else (percentages, means, variances) is derived
+# from those accumulators, and coarser breakdowns are obtained by merging
+# groups (rollup) without reading the data again.
+#
+# M2 is updated with Welford's method and merged with Chan's formula instead
+# of keeping the sum of squares: E[x^2] - mean^2 cancels catastrophically
+# when the values are large compared to their spread (10**9+1, 10**9+2, ...).
+#
+# With NumPy installed from_columns runs vectorized; the results must be the
+# same as the pure Python path. Check it on awkward inputs with:
+#
+#   python -m matrix_exercises.groupby
+
+def _encode_keys(np, column):
+    """
+    Returns (labels, codes) for a key column: labels[codes[i]] == column[i].
+    - Columns of a single Python type use np.unique (vectorized); mixed
+      columns are encoded with a dict so no label changes type (NumPy would
+      turn 1 and "a" into the strings "1" and "a"), and so are columns of
+      tuples (np.asarray would make them a 2-D array).
+    """
+    if len(set(map(type, column))) == 1:
+        data = np.asarray(column)
+        if data.ndim == 1:
+            labels, codes = np.unique(data, return_inverse=True)
+            return labels.tolist(), codes.ravel()
+    index = {}
+    codes = np.fromiter((index.setdefault(value, len(index)) for value in column),
+                        dtype=np.int64, count=len(column))
+    return list(index), codes
+
+
+class GroupBy:
+    """
+    Per-group accumulators for categorical keys and numeric columns.
+
+    - key_names: names of the categorical columns (e.g. ("gender", "works")).
+    - value_names: names of the numeric columns (e.g. ("salary",)).
+    - groups[key_tuple] = [count, sums, m2s, minimums, maximums]
+      where the last four are lists with one entry per numeric column
+      (m2 = sum of squared deviations from the group mean).
+    """
+
+    def __init__(self, key_names, value_names=()):
+        self.key_names = tuple(key_names)
+        self.value_names = tuple(value_names)
+        self.groups = {}
+        self.total = 0  # Rows seen in all groups (base of the percentages)
+
+    @classmethod
+    def from_columns(cls, keys, values=None, use_numpy=None):
+        """
+        Builds the groups from columnar data in a single pass.
+
+        - keys: dict {name: column} of categorical columns.
+        - values: dict {name: column} of numeric columns (same length).
+        - use_numpy: see optional_numpy.
+        """
+        values = values or {}
+        grouped = cls(keys.keys(), values.keys())
+        key_columns = list(keys.values())
+        value_columns = list(values.values())
+        lengths = {len(column) for column in key_columns + value_columns}
+        if len(lengths) > 1:
+            raise ValueError("all columns must have the same length")
+        np = optional_numpy(use_numpy)
+        vectorized = (np is not None and key_columns and lengths and lengths.pop() > 0
+                      and grouped._add_columns_numpy(np, key_columns, value_columns))
+        if not vectorized:
+            for row in zip(*key_columns, *value_columns):
+                grouped.add(row[:len(key_columns)], row[len(key_columns):])
+        return grouped
+
+    def _add_columns_numpy(self, np, key_columns, value_columns):
+        """
+        Vectorized version of from_columns:
+        - each key column is encoded as small integers (_encode_keys),
+        - the codes are combined into one group number per row, renumbered
+          0..groups-1 after every key so it never overflows int64,
+        - counts, sums, M2 (two passes: group means, then squared
+          deviations), minimums and maximums of all groups at once.
+        - Integer columns are accumulated in int64 (exact, like the Python
+          path); columns whose sums could overflow int64, or that are not
+          numeric, go through the Python path instead.
+        - Returns False (nothing added) when some column needs the Python path.
+        """
+        value_arrays = []
+        for column in value_columns:
+            data = np.asarray(column)
+            if data.dtype.kind in "biu":
+                largest = max(abs(int(data.max())), abs(int(data.min())))
+                if largest * len(data) >= 2 ** 63:
+                    return False
+            elif data.dtype.kind != "f":
+                return False
+            value_arrays.append(data)
+
+        inverse = np.zeros(len(key_columns[0]), dtype=np.int64)  # Group of every row
+        levels = []  # (labels, combined numbers of the groups) after every key
+        for column in key_columns:
+            labels, codes = _encode_keys(np, column)
+            # combined < groups so far * len(labels) <= rows * len(labels)
+            numbers, inverse = np.unique(inverse * len(labels) + codes, return_inverse=True)
+            inverse = inverse.ravel()
+            levels.append((labels, numbers.tolist()))
+        size = len(levels[-1][1])
+        counts = np.bincount(inverse, minlength=size)
+        columns_stats = []
+        for data in value_arrays:
+            if data.dtype.kind in "biu":
+                data = data.astype(np.int64)
+                sums = np.zeros(size, dtype=np.int64)
+                minimums = np.full(size, np.iinfo(np.int64).max)
+                maximums = np.full(size, np.iinfo(np.int64).min)
+            else:
+                data = data.astype(np.float64)
+                sums = np.zeros(size)
+                minimums = np.full(size, np.inf)
+                maximums = np.full(size, -np.inf)
+            np.add.at(sums, inverse, data)
+            np.minimum.at(minimums, inverse, data)
+            np.maximum.at(maximums, inverse, data)
+            deviations = data - (sums / counts)[inverse]
+            m2s = np.bincount(inverse, weights=deviations * deviations, minlength=size)
+            columns_stats.append((sums.tolist(), m2s.tolist(), minimums.tolist(),
+                                  maximums.tolist()))
+
+        for g in range(size):
+            # Decode the group back into one label per key column, last key first
+            key = []
+            group = g
+            for labels, numbers in reversed(levels):
+                group, code = divmod(numbers[group], len(labels))
+                key.append(labels[code])
+            stats = [int(counts[g]), [], [], [], []]
+            for column_stats in columns_stats:
+                for part, values in zip(stats[1:], column_stats):
+                    part.append(values[g])  # tolist() gave Python ints/floats
+            self.groups[tuple(reversed(key))] = stats
+            self.total += stats[0]
+        return True
+
+    def add(self, key, values=()):
+        """Adds one record: key is a tuple of categories, values the numbers."""
+        stats = self.groups.get(key)
+        if stats is None:
+            stats = [0, [0] * len(values), [0.0] * len(values),
+                     list(values), list(values)]
+            self.groups[key] = stats
+        count = stats[0]
+        stats[0] = count + 1
+        sums, m2s, minimums, maximums = stats[1], stats[2], stats[3], stats[4]
+        for k, value in enumerate(values):
+            if count:
+                # Welford: deviation from the old mean times deviation from the
+                # new one (numerators first: exact for integer columns)
+                delta = (value * count - sums[k]) / count
+                sums[k] += value
+                m2s[k] += delta * ((value * (count + 1) - sums[k]) / (count + 1))
+            else:
+                sums[k] += value
+            if value < minimums[k]:
+                minimums[k] = value
+            if value > maximums[k]:
+                maximums[k] = value
+        self.total += 1
+
+    def merge(self, other):
+        """Adds the groups of another GroupBy with the same columns."""
+        if (self.key_names, self.value_names) != (other.key_names, other.value_names):
+            raise ValueError("cannot merge groups with different columns")
+        for key, stats in other.groups.items():
+            self._merge_stats(key, stats)
+        self.total += other.total
+
+    def _merge_stats(self, key, stats):
+        mine = self.groups.get(key)
+        if mine is None:
+            self.groups[key] = [stats[0]] + [list(part) for part in stats[1:]]
+            return
+        count, other_count = mine[0], stats[0]
+        mine[0] = count + other_count
+        for k in range(len(self.value_names)):
+            # Chan et al.: M2 of the union from both M2s and the difference of the means
+            delta = (stats[1][k] * count - mine[1][k] * other_count) / (count * other_count)
+            mine[2][k] += stats[2][k] + delta * delta * count * other_count / mine[0]
+            mine[1][k] += stats[1][k]
+            mine[3][k] = min(mine[3][k], stats[3][k])
+            mine[4][k] = max(mine[4][k], stats[4][k])
+
+    def rollup(self, *key_names):
+        """
+        Coarser breakdown using only some of the keys, e.g. rollup("gender").
+        - Merges the existing groups: O(groups), the data is not read again.
+        - rollup() with no names gives a single group () with the totals.
+        """
+        positions = [self.key_names.index(name) for name in key_names]
+        result = GroupBy(key_names, self.value_names)
+        for key, stats in self.groups.items():
+            result._merge_stats(tuple(key[p] for p in positions), stats)
+        result.total = self.total
+        return result
+
+    def count(self, key):
+        """Number of records in the group (0 if it does not exist)."""
+        stats = self.groups.get(key)
+        return stats[0] if stats else 0
+
+    def percentage(self, key):
+        """Percentage of all records that belong to the group."""
+        return 100 * self.count(key) / self.total if self.total else 0
+
+    def statistic(self, key, value_name, statistic, default=0):
+        """
+        Returns sum, mean, min, max or variance (population) of a numeric
+        column within a group; default if the group is empty.
+        """
+        stats = self.groups.get(key)
+        if not stats:
+            return default
+        k = self.value_names.index(value_name)
+        count = stats[0]
+        if statistic == "sum":
+            return stats[1][k]
+        if statistic == "mean":
+            return stats[1][k] / count
+        if statistic == "min":
+            return stats[3][k]
+        if statistic == "max":
+            return stats[4][k]
+        if statistic == "variance":
+            return stats[2][k] / count
+        raise ValueError(f"unknown statistic: {statistic}")
+
+    def mean(self, key, value_name, default=0):
+        """Average of value_name within the group (default if empty)."""
+        return self.statistic(key, value_name, "mean", default)
+
+    def report(self):
+        """
+        Returns {key: {"count", "percentage", value_name: {statistics}}}
+        with groups sorted by key.
+        """
+        try:
+            keys = sorted(self.groups)
+        except TypeError:  # Keys of different types cannot be compared
+            keys = sorted(self.groups, key=repr)
+        result = {}
+        for key in keys:
+            entry = {"count": self.count(key), "percentage": self.percentage(key)}
+            for name in self.value_names:
+                entry[name] = {statistic: self.statistic(key, name, statistic)
+                               for statistic in ("sum", "mean", "min", "max", "variance")}
+            result[key] = entry
+        return result
+
+
+def compare_paths(keys, values=None, tolerance=1e-6):
+    """
+    Builds the groups with use_numpy=True and use_numpy=False and returns
+    the keys whose statistics differ ([] = same result). Needs NumPy.
+    - tolerance: relative difference allowed for floats (the two paths
+      round the sums of float columns differently).
+    """
+    vectorized = GroupBy.from_columns(keys, values, use_numpy=True)
+    plain = GroupBy.from_columns(keys, values, use_numpy=False)
+    different = []
+    for key in set(vectorized.groups) | set(plain.groups):
+        first, second = vectorized.groups.get(key), plain.groups.get(key)
+        if first is None or second is None or first[0] != second[0]:
+            different.append(key)
+            continue
+        for mine, theirs in zip(first[1:], second[1:]):
+            if any(a != b and not math.isclose(a, b, rel_tol=tolerance, abs_tol=tolerance)
+                   for a, b in zip(mine, theirs)):
+                different.append(key)
+                break
+    return different
+
+
+def _check_cases(rows=2000, seed=0):
+    """(name, keys, values) inputs where the NumPy path is easy to get wrong."""
+    rng = random.Random(seed)
+    salary = [rng.randint(0, 10 ** 6) for _ in range(rows)]
+    return [
+        ("no keys (grand total)", {}, {"s": salary}),
+        ("tuple keys", {"pair": [(rng.randint(0, 3), rng.randint(0, 3)) for _ in range(rows)]},
+         {"s": salary}),
+        ("mixed key types", {"k": [rng.choice([1, "a", 2.5]) for _ in range(rows)]},
+         {"s": salary}),
+        ("8 keys of 1000 values (product > 2**63)",
+         {f"k{i}": [rng.randrange(1000) for _ in range(rows)] for i in range(8)},
+         {"s": salary}),
+        ("large integers", {"k": [rng.randrange(3) for _ in range(rows)]},
+         {"s": [10 ** 15 + value for value in salary]}),
+        ("floats", {"k": [rng.choice("xyz") for _ in range(rows)]},
+         {"s": [rng.gauss(10 ** 9, 1) for _ in range(rows)]}),
+    ]
+
+
+def main():
+    if optional_numpy() is None:
+        print("NumPy is not installed: only the Python path exists.")
+        return 0
+    failures = 0
+    for name, keys, values in _check_cases():
+        different = compare_paths(keys, values)
+        failures += bool(different)
+        status = "ok" if not different else f"{len(different)} groups differ"
+        print(f"{name:<42} {status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+# =========================
+# Value histogram (frequency index)
+# =========================
+# Many exercises use small integer ranges (0..10, 0..99, 1..5). For those,
+# one pass that counts how many times each value appears answers questions
+# like "how many times does the maximum appear" or "how many even numbers"
+# without scanning the matrix again.
+
+class ValueHistogram:
+    """
+    Counting index for a matrix whose values are integers in [minimum, maximum].
+
+    - counts[v - minimum] is how many cells hold value v.
+    - If track_positions=True, positions[v - minimum] is the set of (i, j)
+      cells that hold v (costs memory proportional to the matrix).
+    - frequency, parity counts, total and average are O(1);
+      mode, max/min value and max count are O(domain).
+    - Use set_cell to write into the matrix so the index stays up to date.
+    """
+
+    def __init__(self, minimum, maximum, track_positions=False):
+        if maximum < minimum:
+            raise ValueError("maximum must be >= minimum")
+        self.minimum = minimum
+        self.maximum = maximum
+        size = maximum - minimum + 1
+        self.counts = [0] * size
+        self.positions = [set() for _ in range(size)] if track_positions else None
+        self.total = 0          # Number of cells indexed
+        self.sum = 0            # Sum of all values (for the average)
+        self.even = 0           # How many values are even
+
+    @classmethod
+    def from_matrix(cls, matrix, minimum, maximum, track_positions=False):
+        """Builds the index with a single pass over the matrix."""
+        histogram = cls(minimum, maximum, track_positions)
+        for i, row in enumerate(matrix):
+            for j, value in enumerate(row):
+                histogram.add(value, (i, j))
+        return histogram
+
+    def _slot(self, value):
+        """Index of value in counts, with range validation."""
+        if not self.minimum <= value <= self.maximum:
+            raise ValueError(f"value {value} outside [{self.minimum}, {self.maximum}]")
+        return value - self.minimum
+
+    def add(self, value, position=None):
+        """Counts one more occurrence of value (at position, if tracked)."""
+        slot = self._slot(value)
+        self.counts[slot] += 1
+        self.total += 1
+        self.sum += value
+        if value % 2 == 0:
+            self.even += 1
+        if self.positions is not None and position is not None:
+            self.positions[slot].add(position)
+
+    def remove(self, value, position=None):
+        """Forgets one occurrence of value (at position, if tracked)."""
+        slot = self._slot(value)
+        if self.counts[slot] == 0:
+            raise ValueError(f"value {value} is not in the histogram")
+        self.counts[slot] -= 1
+        self.total -= 1
+        self.sum -= value
+        if value % 2 == 0:
+            self.even -= 1
+        if self.positions is not None and position is not None:
+            self.positions[slot].discard(position)
+
+    def set_cell(self, matrix, i, j, value):
+        """Writes matrix[i][j] = value and updates the index in O(1)."""
+        self._slot(value)  # Validate before touching anything
+        self.remove(matrix[i][j], (i, j))
+        matrix[i][j] = value
+        self.add(value, (i, j))
+
+    def frequency(self, value):
+        """How many times value appears (0 if outside the range)."""
+        if not self.minimum <= value <= self.maximum:
+            return 0
+        return self.counts[value - self.minimum]
+
+    def max_value(self):
+        """Largest value present, or None if the histogram is empty."""
+        for slot in range(len(self.counts) - 1, -1, -1):
+            if self.counts[slot]:
+                return slot + self.minimum
+        return None
+
+    def min_value(self):
+        """Smallest value present, or None if the histogram is empty."""
+        for slot, count in enumerate(self.counts):
+            if count:
+                return slot + self.minimum
+        return None
+
+    def max_count(self):
+        """Returns (maximum, how many times it appears)."""
+        maximum = self.max_value()
+        return maximum, self.frequency(maximum) if maximum is not None else 0
+
+    def mode(self):
+        """Most frequent value (the smallest one on ties), or None if empty."""
+        if not self.total:
+            return None
+        best = max(range(len(self.counts)), key=lambda slot: (self.counts[slot], -slot))
+        return best + self.minimum
+
+    def parity_counts(self):
+        """Returns (how many even values, how many odd values)."""
+        return self.even, self.total - self.even
+
+    def average(self):
+        """Arithmetic mean of the indexed values (0 if empty)."""
+        return self.sum / self.total if self.total else 0
+
+    def values_where(self, predicate):
+        """
+        Lists every value satisfying predicate, repeated as many times as it
+        appears, in ascending order. Cost: O(domain + result).
+        """
+        result = []
+        for slot, count in enumerate(self.counts):
+            value = slot + self.minimum
+            if count and predicate(value):
+                result.extend([value] * count)
+        return result
+
+    def even_values(self):
+        """All even values in ascending order."""
+        return self.values_where(lambda value: value % 2 == 0)
+
+    def positions_of(self, value):
+        """Sorted list of (i, j) cells holding value (requires track_positions)."""
+        if self.positions is None:
+            raise ValueError("histogram was built without track_positions=True")
+        if not self.minimum <= value <= self.maximum:
+            return []
+        return sorted(self.positions[value - self.minimum])
@@ -0,0 +1,71 @@
+# =========================
+# Import-time budget
+# =========================
+# Measures how long importing each entry module takes, using the
+# interpreter's own '-X importtime' report in a fresh process (so modules
+# already loaded here don't hide the real cost), and compares it with a
+# budget. Run it with:
+#
+#   python -m matrix_exercises.importtime
+#
+# The exit code is 1 if any module goes over its budget.
+
+import os
+import subprocess
+import sys
+
+# Module -> maximum cumulative import time in milliseconds
+IMPORT_TIME_BUDGETS_MS = {
+    "matrix_exercises": 5,
+    "matrix_exercises.menu": 15,
+    "matrix_exercises.operations": 10,
+}
+
+
+def measure_import_time(module, runs=5):
+    """
+    Returns the cumulative import time of 'module' in milliseconds
+    (best of 'runs' fresh interpreters, to filter out noise).
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=package_root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    best = None
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, env=env, check=True,
+        )
+        # Lines look like: "import time:  self [us] | cumulative | imported package"
+        for line in completed.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                cumulative_ms = int(fields[1]) / 1000
+                best = cumulative_ms if best is None else min(best, cumulative_ms)
+    if best is None:
+        raise RuntimeError(f"no import time reported for {module}")
+    return best
+
+
+def check_import_budgets(budgets=None, runs=5):
+    """
+    Measures every module of 'budgets' and returns a list of
+    (module, measured_ms, budget_ms, within_budget).
+    """
+    budgets = IMPORT_TIME_BUDGETS_MS if budgets is None else budgets
+    results = []
+    for module, budget in budgets.items():
+        measured = measure_import_time(module, runs)
+        results.append((module, measured, budget, measured <= budget))
+    return results
+
+
+def main():
+    results = check_import_budgets()
+    for module, measured, budget, ok in results:
+        status = "ok" if ok else "OVER BUDGET"
+        print(f"{module:<32} {measured:8.2f} ms  (budget {budget} ms)  {status}")
+    return 0 if all(ok for *_, ok in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
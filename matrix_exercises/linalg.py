@@ -0,0 +1,177 @@
+from fractions import Fraction
+
+from .cache import ResultCache
+
+# =========================
+# LU decomposition (determinant, inverse, linear systems)
+# =========================
+# The square matrices of exercises 3 and 4 only get row, column and diagonal
+# sums. LUDecomposition factors a square matrix ONCE with partial pivoting
+# (P*A = L*U, O(n^3)) and then reuses the factors:
+#
+# - determinant: product of the diagonal of U, O(n).
+# - solve: one right-hand side in O(n^2) (forward + back substitution),
+#   solve_matrix: k right-hand sides in O(k * n^2).
+# - inverse: n right-hand sides, computed once and kept.
+#
+# Integer (or Fraction) matrices are factored exactly with
+# fractions.Fraction, so determinants and solutions have no rounding
+# errors; matrices with floats use the faster float path.
+# lu_decompose keeps the factorizations in a small LRU cache keyed by the
+# matrix contents, so determinant/solve_linear/inverse called again on the
+# same matrix don't factor it again. The lookup still reads the whole matrix
+# (O(n^2)): to solve many systems with the same matrix, keep the
+# LUDecomposition returned by lu_decompose and call its methods, or pass it
+# to determinant/solve_linear/inverse instead of the matrix.
+
+FLOAT_TOLERANCE = 1e-12  # Relative size under which a float pivot counts as 0
+
+
+def _is_exact(value):
+    return isinstance(value, (int, Fraction))
+
+
+class LUDecomposition:
+    """
+    P*A = L*U factorization of a square matrix with partial pivoting.
+
+    - exact: True = Fraction arithmetic, False = floats, None = exact if
+      every value is an int or a Fraction.
+    - L (unit lower triangular) and U share one n x n table, lu.
+    - permutation[i] is the row of A that ended up in row i.
+    - A singular matrix can be factored (its determinant is 0), but solve
+      and inverse raise ValueError.
+    """
+
+    def __init__(self, matrix, exact=None):
+        n = len(matrix)
+        if n == 0 or any(len(row) != n for row in matrix):
+            raise ValueError("the matrix must be square and not empty")
+        if exact is None:
+            exact = all(_is_exact(value) for row in matrix for value in row)
+        self.n = n
+        self.exact = exact
+        self.convert = Fraction if exact else float
+        lu = [[self.convert(value) for value in row] for row in matrix]
+        permutation = list(range(n))
+        swaps = 0
+        singular = False
+        if exact:
+            tolerance = 0
+        else:
+            tolerance = FLOAT_TOLERANCE * max(abs(value) for row in lu for value in row)
+
+        for k in range(n):
+            # Partial pivoting: the largest value of column k (rows k..n-1)
+            pivot_row = max(range(k, n), key=lambda i: abs(lu[i][k]))
+            if abs(lu[pivot_row][k]) <= tolerance:
+                singular = True  # Column already eliminated: nothing to do
+                continue
+            if pivot_row != k:
+                lu[k], lu[pivot_row] = lu[pivot_row], lu[k]
+                permutation[k], permutation[pivot_row] = permutation[pivot_row], permutation[k]
+                swaps += 1
+            row_k = lu[k]
+            pivot = row_k[k]
+            for i in range(k + 1, n):
+                row_i = lu[i]
+                factor = row_i[k] / pivot
+                row_i[k] = factor  # Entry of L
+                if factor:
+                    for j in range(k + 1, n):
+                        row_i[j] -= factor * row_k[j]
+
+        self.lu = lu
+        self.permutation = permutation
+        self.swaps = swaps
+        self.singular = singular
+        self._inverse = None
+
+    def determinant(self):
+        """det(A): product of the diagonal of U, negated for odd swaps."""
+        if self.singular:
+            return self.convert(0)
+        result = self.convert(1)
+        for k in range(self.n):
+            result *= self.lu[k][k]
+        return -result if self.swaps % 2 else result
+
+    def solve(self, rhs):
+        """Solves A*x = rhs for one vector rhs of n values; returns x."""
+        if self.singular:
+            raise ValueError("the matrix is singular: the system has no unique solution")
+        n, lu = self.n, self.lu
+        if len(rhs) != n:
+            raise ValueError(f"the right-hand side must have {n} values")
+        # Forward substitution with L (unit diagonal), on the permuted rhs
+        y = [self.convert(rhs[row]) for row in self.permutation]
+        for i in range(1, n):
+            row = lu[i]
+            y[i] -= sum(row[j] * y[j] for j in range(i))
+        # Back substitution with U
+        x = [self.convert(0)] * n
+        for i in range(n - 1, -1, -1):
+            row = lu[i]
+            x[i] = (y[i] - sum(row[j] * x[j] for j in range(i + 1, n))) / row[i]
+        return x
+
+    def solve_matrix(self, rhs):
+        """
+        Solves A*X = rhs for an n x k matrix rhs (k right-hand sides given
+        as its columns); returns the n x k matrix X.
+        """
+        if len(rhs) != self.n:
+            raise ValueError(f"the right-hand side must have {self.n} rows")
+        columns = [self.solve(column) for column in zip(*rhs)]
+        return [list(row) for row in zip(*columns)]
+
+    def inverse(self):
+        """A^-1 (computed on the first call and kept)."""
+        if self._inverse is None:
+            identity = [[int(i == j) for j in range(self.n)] for i in range(self.n)]
+            self._inverse = self.solve_matrix(identity)
+        return [list(row) for row in self._inverse]  # Copy: callers may modify it
+
+
+_lu_cache = ResultCache(max_entries=32)
+
+
+def lu_decompose(matrix, exact=None, cache=None):
+    """
+    Returns the LUDecomposition of matrix, reusing a cached one when the
+    same matrix (same values) was already factored.
+    - The cached object is shared: treat it as read-only.
+    - Keep it to solve several right-hand sides: each lookup copies and
+      hashes the whole matrix.
+    """
+    cache = _lu_cache if cache is None else cache
+    if exact is None:
+        exact = all(_is_exact(value) for row in matrix for value in row)
+    # Hashable copy of the values (1 == 1.0, so exact is part of the key)
+    key = ("lu", tuple(map(tuple, matrix)), exact)
+    return cache.get_or_compute(key, lambda: LUDecomposition(matrix, exact))
+
+
+def _factors(matrix, exact):
+    """matrix itself if it is already an LUDecomposition, else lu_decompose(matrix)."""
+    if isinstance(matrix, LUDecomposition):
+        return matrix
+    return lu_decompose(matrix, exact)
+
+
+def determinant(matrix, exact=None):
+    """Determinant of a square matrix (exact for integer matrices) or of an LUDecomposition."""
+    return _factors(matrix, exact).determinant()
+
+
+def solve_linear(matrix, rhs, exact=None):
+    """
+    Solution x of matrix * x = rhs for one vector rhs.
+    - matrix may be an LUDecomposition: no cache lookup, O(n^2) per call.
+    """
+    return _factors(matrix, exact).solve(rhs)
+
+
+def inverse(matrix, exact=None):
+    """Inverse of a non-singular square matrix (or of an LUDecomposition)."""
+    return _factors(matrix, exact).inverse()
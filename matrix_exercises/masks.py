@@ -0,0 +1,201 @@
+import array
+import operator
+
+from .reshape import flatten
+from .utils import optional_numpy
+
+# =========================
+# Predicates and masks (filtering)
+# =========================
+# Exercise 9 filters the even numbers and exercise 10 finds the positions of
+# the maximum with comprehensions that build a tuple for every match. Here a
+# query is a Predicate (equals, between, is_even, ... combined with & | ~)
+# and its result is a Mask: one bit per cell packed into a single Python
+# int, so combining masks is one big-integer operation done in C.
+#
+# - Bit k of the mask is the cell with row-major index k (i*columns + j).
+# - A composed predicate is evaluated in ONE pass over the matrix.
+# - With NumPy installed, simple predicates are evaluated vectorized.
+
+class Predicate:
+    """
+    Condition on a single value, composable with & (and), | (or), ~ (not).
+
+    - test: function value -> bool, used by the pure Python path.
+    - vectorized: function numpy_array -> boolean array (optional).
+    """
+
+    def __init__(self, test, vectorized=None, description="predicate"):
+        self.test = test
+        self.vectorized = vectorized
+        self.description = description
+
+    def __repr__(self):
+        return f"Predicate({self.description})"
+
+    def __call__(self, value):
+        return self.test(value)
+
+    def _combine(self, other, logical, bitwise, symbol):
+        first, second = self.test, other.test
+        vectorized = None
+        if self.vectorized is not None and other.vectorized is not None:
+            first_v, second_v = self.vectorized, other.vectorized
+            vectorized = lambda values: bitwise(first_v(values), second_v(values))
+        return Predicate(lambda value: logical(first(value), second(value)), vectorized,
+                         f"({self.description} {symbol} {other.description})")
+
+    def __and__(self, other):
+        return self._combine(other, lambda a, b: a and b, operator.and_, "&")
+
+    def __or__(self, other):
+        return self._combine(other, lambda a, b: a or b, operator.or_, "|")
+
+    def __invert__(self):
+        test, vectorized = self.test, self.vectorized
+        return Predicate(lambda value: not test(value),
+                         None if vectorized is None else lambda values: ~vectorized(values),
+                         f"~{self.description}")
+
+    def evaluate(self, matrix, use_numpy=None):
+        """
+        Returns the Mask of the cells of a rectangular matrix that satisfy
+        the predicate. use_numpy: see optional_numpy (NumPy is only used
+        when the predicate is vectorizable).
+        """
+        rows = len(matrix)
+        columns = len(matrix[0]) if rows else 0
+        if use_numpy and not self.vectorized:
+            raise ImportError("use_numpy=True requires a vectorizable predicate")
+        np = optional_numpy(use_numpy) if self.vectorized else None
+        if np is not None and rows and columns:
+            selected = np.asarray(self.vectorized(np.asarray(
+                matrix.tolist() if hasattr(matrix, "tolist") else matrix)), dtype=bool)
+            packed = np.packbits(selected.ravel(), bitorder="little").tobytes()
+            return Mask(int.from_bytes(packed, "little"), rows, columns)
+        test = self.test
+        # One character per cell, lowest index last, then a single C conversion
+        bits = "".join(["1" if test(value) else "0" for value in flatten(matrix)])
+        if len(bits) != rows * columns:
+            raise ValueError("the matrix must be rectangular")
+        return Mask(int(bits[::-1], 2) if bits else 0, rows, columns)
+
+
+def equals(target):
+    """Cells equal to target."""
+    return Predicate(lambda value: value == target, lambda values: values == target,
+                     f"== {target!r}")
+
+
+def between(low, high):
+    """Cells with low <= value <= high."""
+    return Predicate(lambda value: low <= value <= high,
+                     lambda values: (values >= low) & (values <= high),
+                     f"in [{low!r}, {high!r}]")
+
+
+def greater_than(limit):
+    """Cells with value > limit."""
+    return Predicate(lambda value: value > limit, lambda values: values > limit,
+                     f"> {limit!r}")
+
+
+def less_than(limit):
+    """Cells with value < limit."""
+    return Predicate(lambda value: value < limit, lambda values: values < limit,
+                     f"< {limit!r}")
+
+
+def is_even():
+    """Even cells."""
+    return Predicate(lambda value: value % 2 == 0, lambda values: values % 2 == 0, "even")
+
+
+def is_odd():
+    """Odd cells."""
+    return Predicate(lambda value: value % 2 != 0, lambda values: values % 2 != 0, "odd")
+
+
+def where(test, vectorized=None, description="custom"):
+    """Custom predicate from any function value -> bool."""
+    return Predicate(test, vectorized, description)
+
+
+class Mask:
+    """
+    Set of cells of a rows x columns matrix stored as the bits of one int.
+    - &, |, ^ and ~ combine masks of the same shape without loops.
+    - count() is a popcount; positions/flat_indices list the selected cells.
+    """
+
+    def __init__(self, bits, rows, columns):
+        self.bits = bits
+        self.rows = rows
+        self.columns = columns
+
+    @property
+    def size(self):
+        return self.rows * self.columns
+
+    def __repr__(self):
+        return f"Mask({self.count()} of {self.size} cells)"
+
+    def _check(self, other):
+        if (self.rows, self.columns) != (other.rows, other.columns):
+            raise ValueError("masks have different shapes")
+
+    def __and__(self, other):
+        self._check(other)
+        return Mask(self.bits & other.bits, self.rows, self.columns)
+
+    def __or__(self, other):
+        self._check(other)
+        return Mask(self.bits | other.bits, self.rows, self.columns)
+
+    def __xor__(self, other):
+        self._check(other)
+        return Mask(self.bits ^ other.bits, self.rows, self.columns)
+
+    def __invert__(self):
+        return Mask(self.bits ^ ((1 << self.size) - 1), self.rows, self.columns)
+
+    def __eq__(self, other):
+        if not isinstance(other, Mask):
+            return NotImplemented
+        return (self.bits, self.rows, self.columns) == (other.bits, other.rows, other.columns)
+
+    def __contains__(self, position):
+        i, j = position
+        return bool(self.bits >> (i * self.columns + j) & 1)
+
+    def count(self):
+        """Number of selected cells."""
+        return self.bits.bit_count()
+
+    def any(self):
+        return self.bits != 0
+
+    def flat_indices(self):
+        """
+        Row-major indices of the selected cells as a compact array.array('q').
+        - Scans the mask byte by byte: empty bytes (8 cells) are skipped at once.
+        """
+        result = array.array("q")
+        data = self.bits.to_bytes((self.size + 7) // 8, "little")
+        for byte_index, byte in enumerate(data):
+            if byte:
+                base = byte_index * 8
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        result.append(base + bit)
+        return result
+
+    def positions(self):
+        """Yields the (i, j) of every selected cell in row-major order."""
+        columns = self.columns
+        for index in self.flat_indices():
+            yield divmod(index, columns)
+
+    def values(self, matrix):
+        """Values of the selected cells of matrix, in row-major order."""
+        return [matrix[i][j] for i, j in self.positions()]
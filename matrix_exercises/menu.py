@@ -0,0 +1,37 @@
+from .exercises import load_exercise
+from .utils import ask_integer
+
+# =========================
+# Main menu
+# =========================
+
+def print_main_menu():
+    """Prints the list of exercises (shared by the console and network menus)."""
+    print("\n======= MATRIX EXERCISES MENU =======")
+    print("1. Exercise 1: 3x3 matrix with numbers 1 to 9")
+    print("2. Exercise 2: 5xn matrix with random numbers")
+    print("3. Exercise 3: Sum of two n x n matrices")
+    print("4. Exercise 4: Menu of operations on 4x4 matrix")
+    print("5. Exercise 5: 3x3 matrix without repeated numbers")
+    print("6. Exercise 6: Random row or column sum")
+    print("7. Exercise 7: Tic-tac-toe game")
+    print("8. Exercise 8: Survey of 10 people")
+    print("9. Exercise 9: Various operations on 5x5 matrix")
+    print("10. Exercise 10: Read 5x4 matrix from keyboard")
+    print("11. Exercise 11: Irregular matrix generation")
+    print("0. Exit")
+    print("======================================")
+
+
+def main_menu():
+    while True:
+        print_main_menu()
+
+        option = ask_integer("Choose an exercise (0-11): ", minimum=0, maximum=11)
+
+        if option == 0:
+            print("Exiting program... Goodbye!")
+            break
+        else:
+            # Each exercise module is imported only when it is chosen
+            load_exercise(option)()
@@ -0,0 +1,33 @@
+# =========================
+# Operations on square matrices
+# =========================
+# Helper functions for operations on square matrices (used by exercise 4
+# and by several other exercises).
+
+def sum_row(matrix, idx):
+    """Returns the sum of elements in the row with index idx."""
+    return sum(matrix[idx])  # sum() adds all elements of the row list
+
+def sum_column(matrix, idx):
+    """Returns the sum of elements in the column idx."""
+    # Iterate through each row and extract the element at column idx
+    return sum(row[idx] for row in matrix)
+
+def sum_main_diagonal(matrix):
+    """Sums the main diagonal (positions [0,0], [1,1], ...)."""
+    return sum(matrix[i][i] for i in range(len(matrix)))
+
+def sum_secondary_diagonal(matrix):
+    """Sums the secondary diagonal (positions [0,n-1], [1,n-2], ...)."""
+    n = len(matrix)
+    return sum(matrix[i][n - 1 - i] for i in range(n))
+
+def matrix_average(matrix):
+    """
+    Calculates the arithmetic mean of all values in the matrix.
+    - total: sum of all elements
+    - elements: total number of cells (rows * columns)
+    """
+    total = sum(sum(row) for row in matrix)
+    elements = len(matrix) * len(matrix[0])
+    return total / elements if elements > 0 else 0
@@ -0,0 +1,164 @@
+import heapq
+import random
+
+from .reshape import flatten
+
+# =========================
+# Order statistics (top-k, median, percentiles)
+# =========================
+# Exercise 9 sorts the whole matrix just to answer questions like "what is
+# the maximum". These helpers answer top-k, bottom-k, median and percentile
+# queries without a full sort:
+#   - heapq keeps only k candidates in memory: O(n log k).
+#   - quickselect places the k-th element in its final position: O(n) average.
+#   - ReservoirSample keeps a fixed-size random sample of a stream, for
+#     matrices that are too big to hold in memory.
+
+def matrix_top_k(matrix, k):
+    """
+    Returns the k largest values of the matrix in descending order.
+    - heapq.nlargest keeps a heap of size k, so the matrix is never sorted.
+    """
+    return heapq.nlargest(k, flatten(matrix))
+
+
+def matrix_bottom_k(matrix, k):
+    """Returns the k smallest values of the matrix in ascending order."""
+    return heapq.nsmallest(k, flatten(matrix))
+
+
+def quickselect(lst, k, rng=random):
+    """
+    Returns the k-th smallest element (k=0 is the minimum) of lst.
+    - Works IN PLACE: lst is partially reordered.
+    - Three-way partition (< pivot, == pivot, > pivot) so matrices with many
+      repeated values (e.g. numbers 0..10) don't degrade to O(n^2).
+    - Random pivot: O(n) on average regardless of input order.
+    """
+    if not 0 <= k < len(lst):
+        raise IndexError("k out of range")
+    left, right = 0, len(lst) - 1
+    while left < right:
+        pivot = lst[rng.randint(left, right)]
+        # Dutch national flag partition of lst[left..right]
+        lt, i, gt = left, left, right
+        while i <= gt:
+            if lst[i] < pivot:
+                lst[lt], lst[i] = lst[i], lst[lt]
+                lt += 1
+                i += 1
+            elif lst[i] > pivot:
+                lst[i], lst[gt] = lst[gt], lst[i]
+                gt -= 1
+            else:
+                i += 1
+        # Now lst[left..lt-1] < pivot, lst[lt..gt] == pivot, lst[gt+1..right] > pivot
+        if k < lt:
+            right = lt - 1
+        elif k > gt:
+            left = gt + 1
+        else:
+            return pivot
+    return lst[k]
+
+
+def _percentile_of_list(values, p):
+    """
+    Percentile p (0..100) of a list with linear interpolation between the
+    two closest ranks (same definition as numpy.percentile by default).
+    - values is reordered in place by quickselect.
+    """
+    if not values:
+        raise ValueError("percentile of an empty sequence")
+    if not 0 <= p <= 100:
+        raise ValueError("p must be between 0 and 100")
+    position = (len(values) - 1) * p / 100
+    lower = int(position)
+    fraction = position - lower
+    low_value = quickselect(values, lower)
+    if fraction == 0:
+        return low_value
+    # After quickselect everything right of 'lower' is >= low_value,
+    # so the next rank is simply the minimum of that part.
+    high_value = min(values[lower + 1:])
+    return low_value + (high_value - low_value) * fraction
+
+
+def matrix_percentile(matrix, p):
+    """Returns percentile p (0..100) of all values in the matrix."""
+    return _percentile_of_list(list(flatten(matrix)), p)
+
+
+def matrix_median(matrix):
+    """Returns the median of all values (average of the two middle ones if even)."""
+    return matrix_percentile(matrix, 50)
+
+
+class ReservoirSample:
+    """
+    Uniform random sample of fixed size over a stream of values (Algorithm R).
+
+    - Memory is O(size) no matter how many values are added, so it can
+      summarize matrices read row by row from a file or generator.
+    - Percentiles computed on the sample are approximations; with size=10000
+      the error is typically below 1 percentile point.
+    - Pass seed to make the sample reproducible.
+    """
+
+    def __init__(self, size=10000, seed=None):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        self.count = 0          # Total values seen so far
+        self.sample = []
+        self.minimum = None     # Exact extremes are cheap to keep
+        self.maximum = None
+        self._rng = random.Random(seed)
+
+    def add(self, value):
+        """Adds a single value to the stream."""
+        self.count += 1
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        if len(self.sample) < self.size:
+            self.sample.append(value)
+        else:
+            # Keep the new value with probability size/count
+            j = self._rng.randrange(self.count)
+            if j < self.size:
+                self.sample[j] = value
+
+    def extend(self, values):
+        """Adds every value of an iterable."""
+        for value in values:
+            self.add(value)
+
+    def add_rows(self, rows):
+        """Adds every element of an iterable of rows (a matrix or a row stream)."""
+        for row in rows:
+            self.extend(row)
+
+    def percentile(self, p):
+        """Approximate percentile p (0..100); exact for p=0 and p=100."""
+        if p == 0 and self.count:
+            return self.minimum
+        if p == 100 and self.count:
+            return self.maximum
+        return _percentile_of_list(list(self.sample), p)
+
+    def median(self):
+        """Approximate median of the stream."""
+        return self.percentile(50)
+
+
+def streaming_percentiles(rows, percentiles, size=10000, seed=None):
+    """
+    Approximates several percentiles of a matrix given as an iterable of rows
+    in a single pass and O(size) memory.
+    - Returns a dict {p: value}.
+    """
+    reservoir = ReservoirSample(size, seed)
+    reservoir.add_rows(rows)
+    return {p: reservoir.percentile(p) for p in percentiles}
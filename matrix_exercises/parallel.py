@@ -0,0 +1,133 @@
+import array
+import concurrent.futures
+import os
+import random
+import sys
+import weakref
+
+from .views import MatrixView
+
+# =========================
+# Parallel random matrix generation
+# =========================
+# Exercises 2, 3 and 9 fill matrices with random.randint one cell at a
+# time. Here the rows are split into blocks that are generated in parallel:
+#
+# - Every block has its own random.Random seeded from (seed, block number),
+#   so the matrix is the same whatever the number of workers or the pool
+#   type. Workers never share a generator.
+# - "thread": a thread pool writes each block straight into one preallocated
+#   array.array. Threads run truly in parallel on free-threaded CPython
+#   builds (no GIL); with the GIL they still overlap less than processes.
+# - "process": a process pool writes into a multiprocessing shared memory
+#   block and the matrix is returned as a memoryview over that block (no
+#   copy). Raw memoryviews taken from it (as_memoryview) must not outlive
+#   the matrix: the block is unmapped when the matrix is collected.
+# - Small matrices are generated serially: starting a pool costs more.
+
+BLOCK_ROWS = 256            # Rows per task (and per random generator)
+PARALLEL_MIN_CELLS = 200_000  # Below this, "auto" generates serially
+
+
+def gil_disabled():
+    """True when running on a free-threaded CPython build with the GIL off."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _block_values(seed, block, count, low, high):
+    """
+    count random integers in [low, high] from the generator of one block.
+    - choices() over a range draws all values in a C loop, much faster
+      than calling randint count times.
+    """
+    rng = random.Random(f"{seed}:{block}")
+    return rng.choices(range(low, high + 1), k=count)
+
+
+def _fill_block(buffer, typecode, seed, block, start, count, low, high):
+    """Thread task: writes one block into its slice of the shared buffer."""
+    buffer[start:start + count] = array.array(typecode, _block_values(seed, block, count, low, high))
+
+
+def _fill_shared_block(name, typecode, seed, block, start, count, low, high):
+    """Process task: attaches to the shared memory and writes one block."""
+    from multiprocessing import shared_memory
+    values = array.array(typecode, _block_values(seed, block, count, low, high))
+    shared = shared_memory.SharedMemory(name=name)
+    # Byte slice of this block, seen as numbers of the array type
+    view = shared.buf[start * values.itemsize:(start + count) * values.itemsize].cast(typecode)
+    try:
+        view[:] = values
+    finally:
+        view.release()  # The shared memory can't be closed while a view exists
+        shared.close()
+
+
+def parallel_random_matrix(rows, columns, low, high, seed=None, workers=None,
+                           executor="auto", typecode="q"):
+    """
+    Returns a rows x columns MatrixView of random integers in [low, high]
+    stored in one array.array (a memoryview over shared memory for
+    executor="process").
+
+    - seed: same seed -> same matrix (for any workers/executor).
+    - workers: pool size (default: number of CPUs).
+    - executor: "auto", "serial", "thread" or "process". "auto" is serial
+      for small matrices, threads without GIL, processes otherwise.
+    """
+    if rows < 0 or columns < 0:
+        raise ValueError("rows and columns must be >= 0")
+    if high < low:
+        raise ValueError("high must be >= low")
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    workers = workers or os.cpu_count() or 1
+    if executor == "auto":
+        if rows * columns < PARALLEL_MIN_CELLS or workers == 1:
+            executor = "serial"
+        else:
+            executor = "thread" if gil_disabled() else "process"
+    if executor not in ("serial", "thread", "process"):
+        raise ValueError("executor must be 'auto', 'serial', 'thread' or 'process'")
+
+    # (block number, first cell, number of cells) for every block of rows
+    tasks = [(block, first_row * columns, min(BLOCK_ROWS, rows - first_row) * columns)
+             for block, first_row in enumerate(range(0, rows, BLOCK_ROWS))]
+    cells = rows * columns
+    if not cells:
+        return MatrixView(array.array(typecode), rows, columns)  # Nothing to generate
+    if executor in ("serial", "thread"):
+        # Preallocated once; the blocks are written into their slices
+        buffer = array.array(typecode, [0]) * cells
+    if executor == "serial":
+        for block, start, count in tasks:
+            _fill_block(buffer, typecode, seed, block, start, count, low, high)
+    elif executor == "thread":
+        with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+            futures = [pool.submit(_fill_block, buffer, typecode, seed, block, start, count, low, high)
+                       for block, start, count in tasks]
+            for future in futures:
+                future.result()  # Re-raises any error from the workers
+    else:
+        # The workers write into shared memory and the result is a view over
+        # it: no second copy of the matrix in the parent
+        from multiprocessing import shared_memory
+        itemsize = array.array(typecode).itemsize
+        shared = shared_memory.SharedMemory(create=True, size=cells * itemsize)
+        try:
+            with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+                futures = [pool.submit(_fill_shared_block, shared.name, typecode, seed,
+                                       block, start, count, low, high)
+                           for block, start, count in tasks]
+                for future in futures:
+                    future.result()
+        except BaseException:
+            shared.close()
+            raise
+        finally:
+            shared.unlink()  # Only the name: the mapping lives until it is closed
+        buffer = shared.buf[:cells * itemsize].cast(typecode)
+        # Unmapped when the buffer (so the matrix and its views) is collected
+        weakref.finalize(buffer, shared.close).atexit = False
+    return MatrixView(buffer, rows, columns)
@@ -0,0 +1,102 @@
+import itertools
+
+# =========================
+# Flatten, reshape and transpose
+# =========================
+# Exercises 9 and 10 build a flat copy of the matrix and exercise 9 chunks it
+# back into rows with slices. These helpers do the same work lazily
+# (generators) or in place on a flat buffer, so a big matrix is never held
+# twice in memory.
+
+def flatten(matrix):
+    """Yields every element of a matrix (list of lists) row by row."""
+    for row in matrix:
+        yield from row
+
+
+_MISSING = object()  # Sentinel: "the iterator is exhausted"
+
+
+def reshape(values, rows, columns):
+    """
+    Yields 'rows' lists of 'columns' elements taken in order from any
+    iterable (a flat list, flatten(matrix), a file reader...).
+    - Only one row exists in memory at a time.
+    - Raises ValueError if values has fewer or more than rows*columns items.
+    """
+    iterator = iter(values)
+    for _ in range(rows):
+        row = list(itertools.islice(iterator, columns))
+        if len(row) != columns:
+            raise ValueError(f"not enough values for a {rows}x{columns} matrix")
+        yield row
+    if next(iterator, _MISSING) is not _MISSING:
+        raise ValueError(f"too many values for a {rows}x{columns} matrix")
+
+
+def reshape_matrix(matrix, rows, columns):
+    """Returns the elements of matrix rearranged into a rows x columns matrix."""
+    return list(reshape(flatten(matrix), rows, columns))
+
+
+def transpose(matrix, block=64):
+    """
+    Returns the transpose of a rectangular matrix (list of lists).
+    - Works in block x block tiles: the rows being read and the rows being
+      written stay small, which keeps memory accesses local on big matrices.
+    """
+    rows = len(matrix)
+    columns = len(matrix[0]) if rows else 0
+    result = [[None] * rows for _ in range(columns)]
+    for i0 in range(0, rows, block):
+        i1 = min(i0 + block, rows)
+        for j0 in range(0, columns, block):
+            j1 = min(j0 + block, columns)
+            for i in range(i0, i1):
+                source = matrix[i]
+                for j in range(j0, j1):
+                    result[j][i] = source[j]
+    return result
+
+
+def transpose_in_place(buffer, rows, columns, block=64):
+    """
+    Transposes a rows x columns matrix stored row by row in a flat buffer
+    (list or array.array) WITHOUT a second buffer. Returns (columns, rows),
+    the new shape.
+
+    - Square matrices: swaps the tiles above the diagonal with the ones below.
+    - Rectangular matrices: follows the permutation cycles of the positions;
+      a bitmap of rows*columns bits remembers which positions are done.
+    """
+    if len(buffer) != rows * columns:
+        raise ValueError("buffer size does not match rows*columns")
+    if rows == columns:
+        n = rows
+        for i0 in range(0, n, block):
+            for j0 in range(i0, n, block):
+                for i in range(i0, min(i0 + block, n)):
+                    # In the diagonal tile only swap above the diagonal
+                    start = max(j0, i + 1)
+                    for j in range(start, min(j0 + block, n)):
+                        a, b = i * n + j, j * n + i
+                        buffer[a], buffer[b] = buffer[b], buffer[a]
+        return columns, rows
+
+    size = rows * columns
+    last = size - 1
+    done = bytearray((size + 7) // 8)
+    for start in range(1, last):
+        if done[start >> 3] & (1 << (start & 7)):
+            continue
+        # Element at position p moves to (p * rows) mod (size - 1)
+        position = start
+        value = buffer[start]
+        while True:
+            target = (position * rows) % last
+            buffer[target], value = value, buffer[target]
+            done[target >> 3] |= 1 << (target & 7)
+            position = target
+            if position == start:
+                break
+    return columns, rows
@@ -0,0 +1,257 @@
+import asyncio
+import io
+
+from .exercises import load_exercise
+from .exercises.exercise_4 import exercise_4_steps
+from .exercises.exercise_7 import exercise_7_steps
+from .menu import print_main_menu
+from .utils import (
+    capture_output,
+    format_integer_errors,
+    parse_integer,
+    parse_integers,
+)
+
+# =========================
+# Network sessions (asyncio)
+# =========================
+# The console menu is blocking and serves a single user through stdin.
+# Here the same exercises are offered over TCP (or a Unix socket): every
+# connection gets its own ExerciseSession running as an asyncio task, so one
+# process serves many clients without a thread per session.
+#
+# - Questions are answered with 'await session.ask_integer(...)', which
+#   reads a line from the connection instead of calling input().
+# - The exercise code itself is reused: once a session has collected the
+#   answers it runs the exercise with those values in a worker thread (so a
+#   big matrix never stops the other sessions) and sends everything it
+#   printed back to the client.
+# - The menus (exercises 4 and 7) are the same generators of questions used
+#   by the console, driven by the session instead of input().
+# - Sizes sent by clients are bounded, so one client cannot make the server
+#   build a matrix that exhausts its memory, and so are the answer lines
+#   (MAX_LINE_BYTES): a longer line ends the session with a message.
+
+MAX_SESSION_SIZE = 300       # Max n / rows / columns a client may ask for
+MAX_SESSION_ROWS_11 = 100    # Max rows of the irregular matrix (exercise 11)
+MAX_LINE_BYTES = 64 * 1024   # Longest answer line; longer ones close the session
+
+class SessionClosed(ConnectionError):
+    """The client disconnected while the session was waiting for input."""
+
+
+class ExerciseSession:
+    """
+    One client connected to the exercises server.
+
+    - reader/writer are the asyncio streams of the connection.
+    - Every session has its own state (exercise 4 matrix, tic-tac-toe board).
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, text):
+        """Sends text to the client and waits until it is flushed."""
+        self.writer.write(text.encode())
+        await self.writer.drain()
+
+    async def print(self, *values):
+        """Equivalent of print() for the client."""
+        await self.send(" ".join(str(value) for value in values) + "\n")
+
+    def run_captured(self, function, *args):
+        """
+        Runs a quick function on the event loop and returns (result, output).
+        - No 'await' happens while the output is captured, so no other
+          session can print into this buffer.
+        """
+        buffer = io.StringIO()
+        with capture_output(buffer):
+            result = function(*args)
+        return result, buffer.getvalue()
+
+    async def run_sync(self, function, *args):
+        """
+        Runs a regular (non-interactive) function in a worker thread and
+        sends to the client everything it printed.
+        - The output is captured per thread (capture_output), so exercises
+          of different sessions can run at the same time.
+        """
+        loop = asyncio.get_running_loop()
+        result, output = await loop.run_in_executor(None, self.run_captured, function, *args)
+        await self.send(output)
+        return result
+
+    async def run_questions(self, steps):
+        """
+        Drives an interactive exercise written as a generator of questions
+        (see utils.run_questions), answering them from the connection.
+        """
+        answer = None
+        while True:
+            try:
+                question, output = self.run_captured(steps.send, answer)
+            except StopIteration as stop:
+                return stop.value
+            await self.send(output)
+            answer = await self.ask_integer(*question)
+
+    async def read_line(self):
+        """Next answer line of the client (SessionClosed if it left or sent too much)."""
+        try:
+            line = await self.reader.readline()
+        except ValueError:  # Over the stream limit: the rest of the line can't be trusted
+            await self.print(f"Line longer than {MAX_LINE_BYTES} bytes: closing the session.")
+            raise SessionClosed("line too long") from None
+        if not line:
+            raise SessionClosed("client disconnected")
+        return line.decode(errors="replace")
+
+    async def ask_integer(self, message, minimum=None, maximum=None):
+        """Awaitable version of ask_integer that reads from the connection."""
+        while True:
+            await self.send(message)
+            value, error = parse_integer(await self.read_line(), minimum, maximum)
+            if error is None:
+                return value
+            await self.print(error)
+
+    async def ask_integers(self, message, count=None, minimum=None, maximum=None):
+        """Awaitable version of ask_integers (several integers on one line)."""
+        while True:
+            await self.send(message)
+            values, errors = parse_integers(await self.read_line(), minimum, maximum, count)
+            if not errors:
+                return values
+            await self.send("".join(f"{error}\n" for error in format_integer_errors(errors)))
+
+    # ----- Exercises that ask questions -----
+
+    async def exercise_2(self):
+        n = await self.ask_integer("Number of columns (n): ", minimum=1, maximum=MAX_SESSION_SIZE)
+        await self.run_sync(load_exercise(2), n)
+
+    async def exercise_3(self):
+        n = await self.ask_integer("Size n for n x n matrices: ", minimum=1,
+                                   maximum=MAX_SESSION_SIZE)
+        await self.run_sync(load_exercise(3), n)
+
+    async def exercise_4(self):
+        """Same menu as exercise_4, with this session's own matrix."""
+        await self.run_questions(exercise_4_steps())
+
+    async def exercise_6(self):
+        rows = await self.ask_integer("Number of rows: ", minimum=1, maximum=MAX_SESSION_SIZE)
+        columns = await self.ask_integer("Number of columns: ", minimum=1,
+                                         maximum=MAX_SESSION_SIZE)
+        await self.run_sync(load_exercise(6), rows, columns)
+
+    async def exercise_7(self):
+        """Tic-tac-toe for two players sharing this connection."""
+        await self.run_questions(exercise_7_steps())
+
+    async def exercise_10(self):
+        rows, columns = 5, 4
+        await self.print(f"Enter {rows * columns} integers for a {rows}x{columns} matrix (one row per line):")
+        matrix = []
+        for i in range(rows):
+            matrix.append(await self.ask_integers(f"Row {i} ({columns} integers): ", count=columns))
+        await self.run_sync(load_exercise(10), matrix)
+
+    async def exercise_11(self):
+        rows = await self.ask_integer("Number of rows (>=2): ", minimum=2,
+                                      maximum=MAX_SESSION_ROWS_11)
+        column_counts = []
+        for i in range(rows):
+            column_counts.append(
+                await self.ask_integer(f"Number of columns in row {i} (>=1): ", minimum=1,
+                                       maximum=MAX_SESSION_SIZE)
+            )
+        await self.run_sync(load_exercise(11), column_counts)
+
+    # ----- Main menu -----
+
+    async def run(self):
+        """Main menu loop of the session (same options as main_menu)."""
+        # Exercises without questions run directly; the rest use the async
+        # versions. Exercise modules are imported the first time they are used.
+        exercises = {
+            1: lambda: self.run_sync(load_exercise(1)),
+            2: self.exercise_2,
+            3: self.exercise_3,
+            4: self.exercise_4,
+            5: lambda: self.run_sync(load_exercise(5)),
+            6: self.exercise_6,
+            7: self.exercise_7,
+            8: lambda: self.run_sync(load_exercise(8)),
+            9: lambda: self.run_sync(load_exercise(9)),
+            10: self.exercise_10,
+            11: self.exercise_11,
+        }
+        while True:
+            _, menu = self.run_captured(print_main_menu)
+            await self.send(menu)
+            option = await self.ask_integer("Choose an exercise (0-11): ", minimum=0, maximum=11)
+            if option == 0:
+                await self.print("Exiting program... Goodbye!")
+                break
+            await exercises[option]()
+
+
+async def handle_client(reader, writer):
+    """Connection callback: runs one session and always closes the socket."""
+    session = ExerciseSession(reader, writer)
+    try:
+        await session.run()
+    except (SessionClosed, ConnectionError):
+        pass  # Client went away: nothing else to do for this session
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def start_exercise_server(host="127.0.0.1", port=8765, unix_path=None, backlog=1024):
+    """
+    Starts the exercises server and returns the asyncio.Server object.
+    - With unix_path it listens on a Unix socket instead of TCP.
+    - backlog is the queue of pending connections; the asyncio default (100)
+      is too small when thousands of clients connect at once.
+    - port=0 lets the operating system choose a free port
+      (see server.sockets[0].getsockname()).
+    """
+    if unix_path is not None:
+        return await asyncio.start_unix_server(handle_client, path=unix_path, backlog=backlog,
+                                               limit=MAX_LINE_BYTES)
+    return await asyncio.start_server(handle_client, host, port, backlog=backlog,
+                                      limit=MAX_LINE_BYTES)
+
+
+async def serve_exercises(host="127.0.0.1", port=8765, unix_path=None):
+    """Runs the exercises server until the task is cancelled (Ctrl+C)."""
+    server = await start_exercise_server(host, port, unix_path)
+    async with server:
+        await server.serve_forever()
+
+
+async def run_scripted_client(lines, host="127.0.0.1", port=8765, unix_path=None):
+    """
+    Loopback client for trying the server: sends each answer in 'lines'
+    and returns the whole transcript received until the server closes.
+    """
+    if unix_path is not None:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    writer.write("".join(f"{line}\n" for line in lines).encode())
+    await writer.drain()
+    if writer.can_write_eof():
+        writer.write_eof()  # No more answers: the session ends if it asks again
+    transcript = await reader.read()  # Read until the server closes the connection
+    writer.close()
+    await writer.wait_closed()
+    return transcript.decode()
@@ -0,0 +1,532 @@
+import array
+import asyncio
+import bisect
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+import sys
+
+from .operations import sum_column, sum_row
+from .parallel import BLOCK_ROWS, _block_values
+
+# =========================
+# Sharded matrix (worker processes over sockets)
+# =========================
+# A matrix too big for one process is split into row ranges ("shards"),
+# each one held by a worker process that answers requests over a TCP or
+# Unix socket. A ShardedMatrix (the coordinator) routes every query:
+#
+# - sum_row(i) goes only to the shard that holds row i.
+# - sum_column, the diagonals and the average are sent to every shard and
+#   the partial results are merged (sums are added, the average is
+#   total sum / total cells).
+# - query_many() sends ALL the requests of a batch before reading any
+#   answer (pipelining): the round-trips overlap and the shards work in
+#   parallel, instead of one request -> wait -> next request.
+#
+# Workers keep every row as an array.array of int64 (or doubles), about 8
+# bytes per cell instead of about 36 for a list of int objects; rows with
+# integers beyond 64 bits stay lists.
+#
+# Protocol: one JSON object per line. Request {"op": name, "args": [...]},
+# answer {"result": value} or {"error": message}; each connection answers
+# in request order. Workers can run on other machines:
+#   python -m matrix_exercises.sharded 9000 0.0.0.0
+# and are then used with ShardedMatrix.connect([("host", 9000), ...]).
+
+MAX_LINE_BYTES = 64 * 1024 * 1024  # Longest request line a worker accepts
+LOAD_CHUNK_CELLS = 65536            # Cells per "append" request when loading
+LOAD_MAX_PENDING = 64               # Unanswered "append" requests per shard when loading
+
+
+class ShardError(ValueError):
+    """A shard worker could not answer a request (e.g. index out of range)."""
+
+
+# ---------- Worker side ----------
+
+def _pack_row(values):
+    """Row as an array.array of int64 ("q") or doubles ("d"), or a list if neither fits."""
+    try:
+        return array.array("q", values)
+    except OverflowError:
+        return list(values)  # Integers beyond 64 bits stay exact
+    except TypeError:
+        pass
+    try:
+        return array.array("d", values)
+    except (TypeError, OverflowError):
+        return list(values)
+
+
+class Shard:
+    """Rows [first_row, first_row + len(rows)) of the matrix, kept by a worker."""
+
+    def __init__(self):
+        self.first_row = 0
+        self.columns = 0
+        self.rows = []
+        self.stopping = None  # asyncio.Event set by the "shutdown" request
+
+    def _local(self, i):
+        k = i - self.first_row
+        if not 0 <= k < len(self.rows):
+            raise IndexError(f"row {i} is not in this shard")
+        return k
+
+    def op_init(self, first_row, columns):
+        self.first_row, self.columns, self.rows = first_row, columns, []
+
+    def op_append(self, rows):
+        if any(len(row) != self.columns for row in rows):
+            raise ValueError(f"every row must have {self.columns} values")
+        self.rows.extend(map(_pack_row, rows))
+        return len(self.rows)
+
+    def op_fill_random(self, first_row, row_count, total_rows, columns, low, high, seed):
+        """
+        Generates rows [first_row, first_row + row_count) exactly as
+        parallel_random_matrix(total_rows, columns, low, high, seed) would,
+        so the sharded matrix does not depend on the number of shards.
+        """
+        self.op_init(first_row, columns)
+        end = first_row + row_count
+        for block in range(first_row // BLOCK_ROWS, (end - 1) // BLOCK_ROWS + 1 if row_count else 0):
+            block_first = block * BLOCK_ROWS
+            block_rows = min(BLOCK_ROWS, total_rows - block_first)
+            values = _block_values(seed, block, block_rows * columns, low, high)
+            for i in range(max(first_row, block_first), min(end, block_first + block_rows)):
+                offset = (i - block_first) * columns
+                self.rows.append(_pack_row(values[offset:offset + columns]))
+        return len(self.rows)
+
+    def op_shape(self):
+        return [self.first_row, len(self.rows), self.columns]
+
+    def op_get(self, i, j):
+        return self.rows[self._local(i)][j]
+
+    def op_set(self, i, j, value):
+        k = self._local(i)
+        try:
+            self.rows[k][j] = value
+        except (TypeError, OverflowError):  # Does not fit the row type (e.g. a float in "q")
+            row = list(self.rows[k])
+            row[j] = value
+            self.rows[k] = _pack_row(row)
+
+    def op_sum_row(self, i):
+        return sum_row(self.rows, self._local(i))
+
+    def op_sum_column(self, j):
+        if not 0 <= j < self.columns:
+            raise IndexError(f"column {j} out of range")
+        return sum_column(self.rows, j)
+
+    def op_sum_main_diagonal(self):
+        first = self.first_row
+        return sum(row[first + k] for k, row in enumerate(self.rows) if first + k < self.columns)
+
+    def op_sum_secondary_diagonal(self, n):
+        # Same cells as sum_secondary_diagonal on the whole n-row matrix
+        first = self.first_row
+        return sum(row[n - 1 - (first + k)] for k, row in enumerate(self.rows)
+                   if 0 <= n - 1 - (first + k) < self.columns)
+
+    def op_total(self):
+        return [sum(sum(row) for row in self.rows), len(self.rows) * self.columns]
+
+    def op_shutdown(self):
+        self.stopping.set()
+
+    def answer(self, line):
+        """Runs one request line and returns the answer line."""
+        try:
+            request = json.loads(line)
+            method = getattr(self, f"op_{request['op']}", None)
+            if method is None:
+                raise ValueError(f"unknown operation {request['op']!r}")
+            answer = {"result": method(*request.get("args", ()))}
+        except Exception as error:  # Reported to the coordinator, the worker goes on
+            answer = {"error": f"{type(error).__name__}: {error}"}
+        return (json.dumps(answer) + "\n").encode()
+
+
+async def serve_shard(host="127.0.0.1", port=0, unix_path=None, ready=None):
+    """
+    Runs one shard worker until it receives a "shutdown" request.
+    - ready(address) is called once the socket is listening (useful with
+      port=0, where the operating system chooses the port).
+    """
+    shard = Shard()
+    shard.stopping = asyncio.Event()
+
+    async def handle(reader, writer):
+        try:
+            while line := await reader.readline():
+                writer.write(shard.answer(line))
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # Client gone, or the worker is shutting down
+        finally:
+            writer.close()
+
+    if unix_path is not None:
+        server = await asyncio.start_unix_server(handle, path=unix_path, limit=MAX_LINE_BYTES)
+        address = unix_path
+    else:
+        server = await asyncio.start_server(handle, host, port, limit=MAX_LINE_BYTES)
+        address = server.sockets[0].getsockname()[:2]
+    if ready is not None:
+        ready(address)
+    async with server:
+        await shard.stopping.wait()
+
+
+def _worker_process(host, unix_path, connection):
+    """Target of the worker processes: reports the address through a pipe."""
+    asyncio.run(serve_shard(host, 0, unix_path, ready=connection.send))
+
+
+def launch_shard_workers(count, host="127.0.0.1", unix_dir=None, timeout=30):
+    """
+    Starts count local worker processes and returns [(process, address)].
+    - With unix_dir the workers listen on Unix sockets in that folder.
+    """
+    workers = []
+    for k in range(count):
+        unix_path = None if unix_dir is None else os.path.join(unix_dir, f"shard-{k}.sock")
+        parent, child = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(target=_worker_process, args=(host, unix_path, child),
+                                          daemon=True)
+        process.start()
+        child.close()
+        if not parent.poll(timeout):
+            process.terminate()
+            raise ShardError(f"shard worker {k} did not start")
+        address = parent.recv()
+        workers.append((process, address if unix_dir is not None else tuple(address)))
+    return workers
+
+
+# ---------- Coordinator side ----------
+
+class _ShardConnection:
+    """Blocking connection to one worker; requests can be pipelined."""
+
+    def __init__(self, address):
+        if isinstance(address, str):
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.connect(address)
+        else:
+            self.socket = socket.create_connection(tuple(address))
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.file = self.socket.makefile("rwb")
+        self.pending = 0  # Requests sent whose answer has not been read yet
+
+    def send(self, op, args=()):
+        """Queues a request (sent on flush)."""
+        self.file.write((json.dumps({"op": op, "args": list(args)}) + "\n").encode())
+        self.pending += 1
+
+    def flush(self):
+        self.file.flush()
+
+    def receive(self):
+        """Reads the answer to the oldest request still unanswered."""
+        line = self.file.readline()
+        if not line:
+            raise ShardError("the shard worker closed the connection")
+        self.pending -= 1
+        answer = json.loads(line)
+        if "error" in answer:
+            raise ShardError(answer["error"])
+        return answer["result"]
+
+    def request(self, op, *args):
+        self.send(op, args)
+        self.flush()
+        return self.receive()
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
+
+
+def _split_rows(rows, shards):
+    """Splits rows into shards row ranges [(first_row, row_count)], as even as possible."""
+    size, extra = divmod(rows, shards)
+    ranges, first = [], 0
+    for k in range(shards):
+        count = size + (k < extra)
+        ranges.append((first, count))
+        first += count
+    return ranges
+
+
+class ShardedMatrix:
+    """
+    Coordinator of a matrix whose row ranges live in shard workers.
+
+    - ShardedMatrix.random(...) / from_rows(...) / from_chunks(...): fill new local workers
+      (or the running workers at addresses, e.g. on other machines);
+      connect(addresses): use workers that are already loaded.
+    - sum_row, sum_column, sum_main_diagonal, sum_secondary_diagonal,
+      matrix_average, get, set: same results as the in-memory helpers.
+    - query_many([("sum_row", 3), ("sum_column", 0), ...]): one pipelined
+      batch, results in the same order.
+    - Use it as a context manager (or call close) to stop owned workers.
+    """
+
+    def __init__(self, addresses, processes=()):
+        self.processes = list(processes)
+        self.connections = [_ShardConnection(address) for address in addresses]
+        self._refresh_layout()
+
+    def _refresh_layout(self):
+        shapes = self._broadcast("shape")
+        order = sorted(range(len(shapes)), key=lambda k: shapes[k][0])
+        self.connections = [self.connections[k] for k in order]
+        self.first_rows = [shapes[k][0] for k in order]
+        self.rows = sum(shapes[k][1] for k in order)
+        self.columns = max((shapes[k][2] for k in order), default=0)
+
+    @classmethod
+    def connect(cls, addresses):
+        """Coordinator for running workers ((host, port) tuples or Unix paths)."""
+        return cls(addresses)
+
+    @classmethod
+    def _launch(cls, shards, host, unix_dir, addresses):
+        if addresses is not None:
+            return cls(addresses)
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        workers = launch_shard_workers(shards, host, unix_dir)
+        return cls([address for _, address in workers], [process for process, _ in workers])
+
+    @classmethod
+    def random(cls, rows, columns, low, high, seed, shards=2, host="127.0.0.1", unix_dir=None,
+               addresses=None):
+        """
+        Starts shards workers that each generate their rows locally (no
+        matrix data crosses the sockets). Same matrix as
+        parallel_random_matrix(rows, columns, low, high, seed).
+        """
+        if high < low:
+            raise ValueError("high must be >= low")
+        matrix = cls._launch(shards, host, unix_dir, addresses)
+        ranges = _split_rows(rows, len(matrix.connections))
+        for connection, (first, count) in zip(matrix.connections, ranges):
+            connection.send("fill_random", (first, count, rows, columns, low, high, seed))
+        matrix._flush_and_receive_all()
+        matrix._refresh_layout()
+        return matrix
+
+    @classmethod
+    def from_rows(cls, matrix, shards=2, host="127.0.0.1", unix_dir=None, addresses=None,
+                  rows=None, rows_per_shard=None):
+        """
+        Starts shards workers and streams them the rows of a rectangular
+        matrix: any iterable of rows (a list, a generator, ...), read once.
+        Rows are sent in "append" requests as they are read, so the whole
+        matrix is never held by the coordinator.
+
+        - Every shard gets a contiguous range of rows. With rows (the number
+          of rows; len(matrix) when it has one) the ranges are as even as
+          possible; otherwise every shard but the last gets rows_per_shard
+          rows, and the last one gets the rest.
+        """
+        if rows is None and hasattr(matrix, "__len__"):
+            rows = len(matrix)
+        if rows is None and rows_per_shard is None:
+            raise ValueError("rows or rows_per_shard is needed when the matrix has no len()")
+        if rows_per_shard is not None and rows_per_shard < 1:
+            raise ValueError("rows_per_shard must be >= 1")
+        sharded = cls._launch(shards, host, unix_dir, addresses)
+        try:
+            sharded._load(iter(matrix), rows, rows_per_shard)
+        except BaseException:
+            sharded.close()
+            raise
+        sharded._refresh_layout()
+        return sharded
+
+    @classmethod
+    def from_chunks(cls, chunks, shards=2, host="127.0.0.1", unix_dir=None, addresses=None,
+                    rows=None, rows_per_shard=None):
+        """
+        from_rows for a chunk stream (e.g. chunked.read_text_chunks or
+        chunked.read_binary_chunks): the file is read one chunk at a time.
+        """
+        return cls.from_rows(itertools.chain.from_iterable(chunks), shards, host, unix_dir,
+                             addresses, rows, rows_per_shard)
+
+    def _load(self, iterator, rows, rows_per_shard):
+        """Sends the rows of iterator to the shards in order (see from_rows)."""
+        connections = self.connections
+        if rows is not None:
+            quotas = [count for _, count in _split_rows(rows, len(connections))]
+        else:
+            quotas = [rows_per_shard] * len(connections)
+        quotas[-1] = None  # Rows beyond the expected count go to the last shard
+
+        first = next(iterator, None)
+        columns = len(first) if first is not None else 0
+        if first is not None:
+            iterator = itertools.chain([first], iterator)
+        batch_rows = max(1, LOAD_CHUNK_CELLS // max(columns, 1))
+        shard = loaded = 0  # Current shard, rows sent to it
+        total = 0
+        connections[0].send("init", (0, columns))
+        while True:
+            if quotas[shard] is not None and loaded >= quotas[shard]:
+                shard += 1  # Shard full: the next one starts at row total
+                loaded = 0
+                connections[shard].send("init", (total, columns))
+                continue
+            limit = batch_rows if quotas[shard] is None else min(batch_rows, quotas[shard] - loaded)
+            batch = [list(row) for row in itertools.islice(iterator, limit)]
+            if not batch:
+                break
+            connection = connections[shard]
+            connection.send("append", (batch,))
+            if connection.pending > LOAD_MAX_PENDING:
+                connection.flush()
+                connection.receive()  # Keeps the unread answers (and memory) bounded
+            loaded += len(batch)
+            total += len(batch)
+        for connection in connections[shard + 1:]:
+            connection.send("init", (total, columns))  # Shards left empty
+        self._flush_and_receive_all()
+
+    def _flush_and_receive_all(self):
+        """Sends the queued requests and reads every answer (raising the first error)."""
+        for connection in self.connections:
+            connection.flush()
+        error = None
+        for connection in self.connections:
+            while connection.pending:
+                try:
+                    connection.receive()
+                except ShardError as failure:
+                    error = error or failure  # Keep reading: the pipes must be drained
+        if error is not None:
+            raise error
+
+    def _broadcast(self, op, *args):
+        for connection in self.connections:
+            connection.send(op, args)
+        for connection in self.connections:
+            connection.flush()
+        return [connection.receive() for connection in self.connections]
+
+    def _shard_of(self, i):
+        if not 0 <= i < self.rows:
+            raise IndexError(f"row {i} out of range")
+        return bisect.bisect_right(self.first_rows, i) - 1
+
+    def _plan(self, name, args):
+        """Returns ([(shard, op, args)], merge) for one query."""
+        every = range(len(self.connections))
+        if name in ("sum_row", "get", "set"):
+            shard = self._shard_of(args[0])
+            return [(shard, name, args)], lambda results: results[0]
+        if name in ("sum_column", "sum_main_diagonal"):
+            return [(k, name, args) for k in every], sum
+        if name == "sum_secondary_diagonal":
+            return [(k, name, (self.rows,)) for k in every], sum
+        if name == "matrix_average":
+            def merge(results):
+                total = sum(result[0] for result in results)
+                cells = sum(result[1] for result in results)
+                return total / cells if cells > 0 else 0
+            return [(k, "total", ()) for k in every], merge
+        raise ValueError(f"unknown query {name!r}")
+
+    def query_many(self, queries):
+        """
+        Runs a batch of queries (name, *args) with pipelining: every
+        request is written before any answer is read. Returns the results.
+        """
+        plans = [self._plan(name, tuple(args)) for name, *args in queries]
+        for requests, _ in plans:
+            for shard, op, args in requests:
+                self.connections[shard].send(op, args)
+        for connection in self.connections:
+            connection.flush()
+        # Each connection answers in order, so reading back in the same
+        # order matches every answer with its request
+        results = []
+        error = None
+        for requests, merge in plans:
+            answers = []
+            for shard, _, _ in requests:
+                try:
+                    answers.append(self.connections[shard].receive())
+                except ShardError as failure:
+                    error = error or failure  # Keep reading: the pipes must be drained
+            if len(answers) == len(requests):
+                results.append(merge(answers))
+        if error is not None:
+            raise error
+        return results
+
+    def query(self, name, *args):
+        return self.query_many([(name, *args)])[0]
+
+    def sum_row(self, i):
+        return self.query("sum_row", i)
+
+    def sum_column(self, j):
+        return self.query("sum_column", j)
+
+    def sum_main_diagonal(self):
+        return self.query("sum_main_diagonal")
+
+    def sum_secondary_diagonal(self):
+        return self.query("sum_secondary_diagonal")
+
+    def matrix_average(self):
+        return self.query("matrix_average")
+
+    def get(self, i, j):
+        return self.query("get", i, j)
+
+    def set(self, i, j, value):
+        self.query("set", i, j, value)
+
+    def close(self):
+        """Closes the connections and stops the workers started by this object."""
+        for connection in self.connections:
+            if self.processes:
+                try:
+                    connection.request("shutdown")
+                except (ShardError, OSError):
+                    pass
+            connection.close()
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.connections, self.processes = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    """python -m matrix_exercises.sharded [port] [host]: runs one shard worker."""
+    argv = sys.argv[1:] if argv is None else argv
+    port = int(argv[0]) if argv else 9000
+    host = argv[1] if len(argv) > 1 else "127.0.0.1"
+    asyncio.run(serve_shard(host, port, ready=lambda address: print(f"Shard worker on {address}")))
+
+
+if __name__ == "__main__":
+    main()
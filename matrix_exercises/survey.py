@@ -0,0 +1,183 @@
+import csv
+import itertools
+import json
+import math
+import os
+
+from .groupby import GroupBy
+
+# =========================
+# Survey ingestion (CSV / JSON Lines)
+# =========================
+# Exercise 8 invents 10 respondents. Here real survey files are read in
+# chunks of records, every record is validated, and the running totals are
+# kept in a GroupBy with at most 4 groups (gender x works), so:
+#   - memory does not grow with the file size (only one chunk is in memory),
+#   - a report with the same figures as exercise 8 can be printed at any
+#     moment, e.g. after every chunk of a multi-gigabyte file.
+#
+# Record fields (same codes as exercise 8):
+#   gender: 1=male, 2=female    works: 1=yes, 2=no
+#   salary: > 0 if the person works, 0 otherwise
+
+SURVEY_FIELDS = ("gender", "works", "salary")
+
+
+class SurveyRecordError(ValueError):
+    """A survey record is missing fields or has invalid values."""
+
+
+def _to_number(value, field):
+    """Converts a CSV/JSON field to int (or float for decimal salaries)."""
+    if isinstance(value, bool):
+        raise SurveyRecordError(f"{field} is not a number: {value!r}")
+    if isinstance(value, int):
+        return value
+    if not isinstance(value, float):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            pass
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise SurveyRecordError(f"{field} is not a number: {value!r}") from None
+    # JSON NaN/Infinity or CSV "nan"/"inf" would spoil every running average
+    if not math.isfinite(value):
+        raise SurveyRecordError(f"{field} is not a finite number: {value!r}")
+    return value
+
+
+def validate_record(record):
+    """
+    Checks one record (a dict) and returns (gender, works, salary).
+    Raises SurveyRecordError explaining the first problem found.
+    """
+    missing = [field for field in SURVEY_FIELDS if record.get(field) in (None, "")]
+    if missing:
+        raise SurveyRecordError(f"missing field(s): {', '.join(missing)}")
+    gender = _to_number(record["gender"], "gender")
+    works = _to_number(record["works"], "works")
+    salary = _to_number(record["salary"], "salary")
+    if gender not in (1, 2):
+        raise SurveyRecordError(f"gender must be 1 or 2, got {gender!r}")
+    if works not in (1, 2):
+        raise SurveyRecordError(f"works must be 1 or 2, got {works!r}")
+    if works == 1 and salary <= 0:
+        raise SurveyRecordError(f"a person who works must have salary > 0, got {salary!r}")
+    if works == 2 and salary != 0:
+        raise SurveyRecordError(f"a person who does not work must have salary 0, got {salary!r}")
+    return int(gender), int(works), salary
+
+
+def iter_survey_records(path, file_format=None):
+    """
+    Yields (line_number, record_dict) from a CSV file with a header row or
+    a JSON Lines file (one object per line). file_format is "csv" or
+    "jsonl"; by default it is chosen from the file extension.
+    """
+    if file_format is None:
+        extension = os.path.splitext(path)[1].lower()
+        file_format = "jsonl" if extension in (".jsonl", ".ndjson", ".json") else "csv"
+    # utf-8-sig drops the byte order mark that Excel puts at the start of
+    # its UTF-8 exports (it would end up in the first header name)
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        if file_format == "csv":
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, record
+        elif file_format == "jsonl":
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as error:
+                    record = {"_error": f"invalid JSON: {error.msg}"}
+                if not isinstance(record, dict):
+                    record = {"_error": "each line must be a JSON object"}
+                yield line_number, record
+        else:
+            raise ValueError("file_format must be 'csv' or 'jsonl'")
+
+
+class SurveyReport:
+    """
+    Running survey statistics, updated chunk by chunk.
+
+    - add_records: validates and adds an iterable of (line, record).
+    - summary / print_report: the exercise 8 figures at this moment.
+    - Invalid records are counted; the first max_errors are kept with their
+      line number so they can be reported.
+    """
+
+    def __init__(self, max_errors=100):
+        self.groups = GroupBy(("gender", "works"), ("salary",))
+        self.invalid = 0
+        self.errors = []  # (line_number, message), at most max_errors
+        self.max_errors = max_errors
+
+    @property
+    def valid(self):
+        return self.groups.total
+
+    def add_records(self, records):
+        """Adds (line_number, record) pairs; invalid ones are only counted."""
+        add = self.groups.add
+        for line_number, record in records:
+            try:
+                if "_error" in record:
+                    raise SurveyRecordError(record["_error"])
+                gender, works, salary = validate_record(record)
+            except SurveyRecordError as error:
+                self.invalid += 1
+                if len(self.errors) < self.max_errors:
+                    self.errors.append((line_number, str(error)))
+                continue
+            add((gender, works), (salary,))
+
+    def summary(self):
+        """Percentages and average salaries with the records seen so far."""
+        by_gender = self.groups.rollup("gender")
+        return {
+            "respondents": self.valid,
+            "invalid": self.invalid,
+            "pct_males": by_gender.percentage((1,)),
+            "pct_females": by_gender.percentage((2,)),
+            "pct_males_working": self.groups.percentage((1, 1)),
+            "pct_females_working": self.groups.percentage((2, 1)),
+            "avg_males": self.groups.mean((1, 1), "salary"),
+            "avg_females": self.groups.mean((2, 1), "salary"),
+        }
+
+    def print_report(self):
+        """Prints the current figures with the same wording as exercise 8."""
+        summary = self.summary()
+        print(f"Valid records: {summary['respondents']}, invalid records: {summary['invalid']}")
+        print(f"Percentage of males: {summary['pct_males']:.1f}%")
+        print(f"Percentage of females: {summary['pct_females']:.1f}%")
+        print(f"Percentage of males who work: {summary['pct_males_working']:.1f}%")
+        print(f"Percentage of females who work: {summary['pct_females_working']:.1f}%")
+        print(f"Average salary of males who work: {summary['avg_males']:.2f}")
+        print(f"Average salary of females who work: {summary['avg_females']:.2f}")
+
+
+def ingest_survey(path, file_format=None, chunk_size=10000, on_chunk=None, report=None):
+    """
+    Streams a survey file into a SurveyReport, chunk_size records at a time.
+
+    - on_chunk(report) is called after every chunk (e.g. to print progress
+      or a partial report).
+    - Pass an existing report to accumulate several files.
+    - Returns the report.
+    """
+    report = SurveyReport() if report is None else report
+    records = iter_survey_records(path, file_format)
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            break
+        report.add_records(chunk)
+        if on_chunk is not None:
+            on_chunk(report)
+    return report
@@ -0,0 +1,139 @@
+import random
+
+from .reshape import reshape
+
+# =========================
+# Unique random matrices of any size
+# =========================
+# Exercise 5 shuffles list(range(1, 10)): perfect for 9 numbers, but a big
+# matrix drawn from a huge range would need the whole range in memory.
+# These generators produce non-repeating values for any shape and range:
+#   - "sample":  random.sample over a range object (the range is never
+#                expanded), O(cells) memory.
+#   - "floyd":   Floyd's algorithm, O(cells) memory, one random draw per cell.
+#   - "feistel": a keyed pseudo-random permutation of the range that is
+#                streamed value by value, O(1) memory.
+# The same seed always produces the same matrix.
+
+UNIQUE_SAMPLING_METHODS = ("auto", "sample", "floyd", "feistel")
+
+
+class FeistelPermutation:
+    """
+    Pseudo-random permutation of 0..size-1 driven by a seed.
+
+    - A Feistel network mixes the two halves of the bits of a number; it is
+      a bijection on [0, 2**bits), whatever the round function is.
+    - Values >= size are re-encrypted until they fall inside the range
+      ("cycle walking"), which keeps the bijection on 0..size-1.
+    - perm[i] is computed on demand, so nothing is stored per element.
+    """
+
+    def __init__(self, size, seed=None, rounds=4):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        self.half_bits = (bits + 1) // 2
+        self.half_mask = (1 << self.half_bits) - 1
+        rng = random.Random(seed)
+        self.keys = [rng.getrandbits(64) for _ in range(rounds)]
+
+    def _round(self, value, key):
+        """Round function: cheap integer hash of one half with a round key."""
+        value = ((value ^ key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        value ^= value >> 29
+        return value & self.half_mask
+
+    def _encrypt(self, value):
+        left, right = value >> self.half_bits, value & self.half_mask
+        for key in self.keys:
+            left, right = right, left ^ self._round(right, key)
+        return (left << self.half_bits) | right
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError("permutation index out of range")
+        value = self._encrypt(index)
+        while value >= self.size:  # Cycle walking: at most a few steps on average
+            value = self._encrypt(value)
+        return value
+
+    def __iter__(self):
+        for index in range(self.size):
+            yield self[index]
+
+
+def _floyd_sample(rng, size, count):
+    """
+    Floyd's algorithm: count distinct numbers of 0..size-1 with exactly count
+    random draws. The set is shuffled at the end to get a random order.
+    """
+    chosen = set()
+    for j in range(size - count, size):
+        t = rng.randint(0, j)
+        chosen.add(j if t in chosen else t)
+    result = list(chosen)
+    rng.shuffle(result)
+    return result
+
+
+def unique_random_values(count, low, high, seed=None, method="auto"):
+    """
+    Returns an iterator of count distinct integers from [low, high] in
+    random order.
+
+    - method: "sample", "floyd", "feistel" or "auto" (streaming Feistel
+      permutation for more than a million values, random.sample otherwise).
+    - Raises ValueError right away if the range has fewer than count values.
+    """
+    size = high - low + 1
+    if count < 0:
+        raise ValueError("count must be >= 0")
+    if count > size:
+        raise ValueError(f"cannot draw {count} distinct values from [{low}, {high}]")
+    if method not in UNIQUE_SAMPLING_METHODS:
+        raise ValueError(f"method must be one of {UNIQUE_SAMPLING_METHODS}")
+    if method == "auto":
+        method = "feistel" if count > 1_000_000 else "sample"
+    return _iter_unique_values(count, low, high, seed, method)
+
+
+def _iter_unique_values(count, low, high, seed, method):
+    """Generator behind unique_random_values (arguments already validated)."""
+    if count == 0:
+        return
+    if method == "feistel":
+        permutation = FeistelPermutation(high - low + 1, seed)
+        for index in range(count):
+            yield low + permutation[index]
+        return
+
+    rng = random.Random(seed)
+    if method == "sample":
+        # range(...) is a lazy sequence: sample never builds the full list
+        yield from rng.sample(range(low, high + 1), count)
+    else:
+        for value in _floyd_sample(rng, high - low + 1, count):
+            yield low + value
+
+
+def unique_random_rows(rows, columns, low=1, high=None, seed=None, method="auto"):
+    """
+    Yields the rows of a rows x columns matrix without repeated values.
+    - By default the values are 1..rows*columns (a shuffled matrix, like
+      exercise 5); pass high to draw from a bigger range.
+    - With method="feistel" only one row is in memory at a time.
+    """
+    if high is None:
+        high = low + rows * columns - 1
+    values = unique_random_values(rows * columns, low, high, seed, method)
+    yield from reshape(values, rows, columns)
+
+
+def unique_random_matrix(rows, columns, low=1, high=None, seed=None, method="auto"):
+    """Returns a rows x columns matrix (list of lists) without repeated values."""
+    return list(unique_random_rows(rows, columns, low, high, seed, method))
@@ -0,0 +1,278 @@
+# _thread (the low-level module behind threading) is already loaded by the
+# interpreter: importing threading/contextlib here would triple the import
+# time of every exercise (see importtime.py).
+import _thread
+import sys
+
+# =========================
+# Utilities and validations
+# =========================
+# In this section we define general-purpose functions that are reused
+# in several exercises. Separating utilities makes code easier to test and maintain.
+
+def parse_integer(text, minimum=None, maximum=None):
+    """
+    Converts a text into an integer with type and range validation.
+
+    - Returns (value, None) if the text is a valid integer within range.
+    - Returns (None, error_message) otherwise, so the caller decides how to
+      report the error (print it, send it over a socket, ...).
+    """
+    try:
+        # Try to convert the text to integer
+        value = int(text)
+    except ValueError:
+        return None, "Invalid input. You must enter a whole number."
+    # Lower bound validation (if provided)
+    if minimum is not None and value < minimum:
+        return None, f"The value must be >= {minimum}."
+    # Upper bound validation (if provided)
+    if maximum is not None and value > maximum:
+        return None, f"The value must be <= {maximum}."
+    return value, None
+
+
+def ask_integer(message, minimum=None, maximum=None):
+    """
+    Asks the user for an integer with type and range validation.
+
+    Parameters:
+    - message: text shown to the user to request the number.
+    - minimum: if specified, the entered value must be >= minimum.
+    - maximum: if specified, the entered value must be <= maximum.
+
+    Flow:
+    - Repeats until the user enters a valid integer.
+    - Handles ValueError if the user enters letters or non-integer numbers.
+    - Checks range if minimum/maximum are provided.
+    - Returns the validated integer.
+    """
+    while True:
+        # Validation is shared with the network sessions (parse_integer)
+        value, error = parse_integer(input(message), minimum, maximum)
+        if error is None:
+            return value  # Valid value: return it
+        print(error)  # Show what was wrong and ask again
+
+
+def parse_integers(text, minimum=None, maximum=None, count=None):
+    """
+    Converts a whole line of integers (separated by spaces or commas) at once.
+
+    - Returns (values, errors). errors is a list of (position, token, message)
+      with the 0-based position of every wrong value, so all mistakes can be
+      reported together instead of one prompt per value.
+    - If count is given, a different number of values is also an error
+      (position None).
+    - Fast path: all tokens are converted in one comprehension and the range
+      is checked with min()/max(); tokens are examined one by one only when
+      something is wrong.
+    """
+    tokens = text.replace(",", " ").split()
+    try:
+        values = [int(token) for token in tokens]
+        in_range = not values or (
+            (minimum is None or min(values) >= minimum)
+            and (maximum is None or max(values) <= maximum))
+    except ValueError:
+        in_range = False
+    errors = []
+    if not in_range:
+        # Slow path: find every wrong token and why it is wrong
+        values = []
+        for position, token in enumerate(tokens):
+            value, error = parse_integer(token, minimum, maximum)
+            if error is None:
+                values.append(value)
+            else:
+                errors.append((position, token, error))
+    if count is not None and len(tokens) != count:
+        errors.append((None, "", f"Expected {count} values, got {len(tokens)}."))
+    return values, errors
+
+
+def parse_integer_rows(lines, minimum=None, maximum=None, columns=None):
+    """
+    Parses a matrix given as lines of integers (a file, sys.stdin, a list of
+    strings...) in a single pass. Blank lines are skipped.
+
+    - Returns (matrix, errors) where errors are (row, column, token, message)
+      with 0-based positions, like the [i,j] element prompts.
+    - columns: required length of every row (None = same as the first row).
+    """
+    matrix = []
+    errors = []
+    for line in lines:
+        if not line.strip():
+            continue
+        i = len(matrix)
+        row, row_errors = parse_integers(line, minimum, maximum)
+        for j, token, message in row_errors:
+            errors.append((i, j, token, message))
+        if columns is None:
+            columns = len(row) + len(row_errors)
+        length = len(row) + len(row_errors)
+        if length != columns:
+            errors.append((i, None, "", f"Expected {columns} values, got {length}."))
+        matrix.append(row)
+    return matrix, errors
+
+
+def format_integer_errors(errors):
+    """Turns the errors of parse_integers into readable lines."""
+    lines = []
+    for position, token, message in errors:
+        if position is None:
+            lines.append(message)
+        else:
+            lines.append(f"Value {position} ({token!r}): {message}")
+    return lines
+
+
+def ask_integers(message, count=None, minimum=None, maximum=None):
+    """
+    Asks for several integers on one line (bulk version of ask_integer).
+    - Shows ALL the errors of the line at once and asks for the line again.
+    - Returns the list of validated integers.
+    """
+    while True:
+        values, errors = parse_integers(input(message), minimum, maximum, count)
+        if not errors:
+            return values
+        for line in format_integer_errors(errors):
+            print(line)
+
+
+def run_questions(steps, ask=ask_integer):
+    """
+    Drives an interactive exercise written as a generator of questions.
+
+    - The generator yields (message, minimum, maximum) and receives the
+      validated answer, so the same loop works with any input source.
+    - ask(message, minimum, maximum) answers each question: ask_integer for
+      the console; the network sessions answer asynchronously instead.
+    - Returns the value returned by the generator.
+    """
+    answer = None
+    while True:
+        try:
+            question = steps.send(answer)
+        except StopIteration as stop:
+            return stop.value
+        answer = ask(*question)
+
+
+class _ThreadStdout:
+    """
+    sys.stdout replacement that sends the writes of each thread to the
+    stream that thread set with capture_output (the real stdout otherwise).
+    """
+
+    def __init__(self, default):
+        self.default = default
+        self.local = _thread._local()
+
+    def _stream(self):
+        stream = getattr(self.local, "stream", None)
+        return self.default if stream is None else stream
+
+    def write(self, text):
+        return self._stream().write(text)
+
+    def flush(self):
+        self._stream().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream(), name)
+
+
+_stdout_lock = _thread.allocate_lock()
+
+
+class _OutputCapture:
+    """Context manager returned by capture_output."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __enter__(self):
+        with _stdout_lock:
+            if not isinstance(sys.stdout, _ThreadStdout):
+                sys.stdout = _ThreadStdout(sys.stdout)
+            self.router = sys.stdout
+        self.previous = getattr(self.router.local, "stream", None)
+        self.router.local.stream = self.stream
+        return self.stream
+
+    def __exit__(self, *exc_info):
+        self.router.local.stream = self.previous
+
+
+def capture_output(stream):
+    """
+    Sends what THIS thread prints to stream inside a 'with' block.
+    - Unlike contextlib.redirect_stdout, other threads keep printing to
+      their own destination, so exercises can run concurrently in threads.
+    """
+    return _OutputCapture(stream)
+
+
+def print_matrix(matrix, width=4):
+    """
+    Prints a matrix (list of lists) with aligned columns.
+
+    Parameters:
+    - matrix: list of lists (each sublist is a row).
+    - width: minimum width for each element (useful for aligning numbers).
+    """
+    # Iterate through each row and build a string with aligned elements
+    for row in matrix:
+        # f"{elem:>{width}}" -> right-justified with fixed width
+        print(" ".join(f"{elem:>{width}}" for elem in row))
+    print()  # Blank line after matrix for clarity
+
+
+def create_matrix(rows, columns, value=0):
+    """
+    Creates and initializes a matrix (list of lists) with a default value.
+
+    - Avoids sharing the same internal list using nested comprehension.
+    - Returns a matrix with 'rows' rows and 'columns' columns initialized to 'value'.
+    """
+    return [[value for _ in range(columns)] for _ in range(rows)]
+
+
+def optional_numpy(use_numpy=None):
+    """
+    Returns the numpy module if it is installed, or None.
+    - NumPy is optional: every feature that uses it also has a pure Python path.
+    - use_numpy is the argument of the functions that have both paths:
+      None = NumPy if installed, False = None (pure Python), True = NumPy
+      or ImportError if it is not installed.
+    """
+    if use_numpy is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if use_numpy:
+            raise ImportError("use_numpy=True requires NumPy") from None
+        return None
+    return numpy
+
+
+def numpy_sum_dtype(np, values):
+    """
+    dtype wide enough to add every value of the NumPy array without
+    wrapping: int64 for ints/bools whose total fits, float64 for floats and
+    Python ints (object) otherwise, so sums match the pure Python paths.
+    """
+    kind = values.dtype.kind
+    if kind == "b":
+        return np.int64
+    if kind in "iu":
+        largest = max(abs(int(values.max())), abs(int(values.min()))) if values.size else 0
+        return np.int64 if largest * values.size < 2 ** 63 else object
+    if kind == "f":
+        return np.float64
+    return object
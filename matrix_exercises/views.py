@@ -0,0 +1,231 @@
+import array
+
+# =========================
+# Matrix views (no copies)
+# =========================
+# Exercises 5 and 9 rebuild matrices by slicing flat lists, and sum_column
+# walks every row to collect a column. A view stores only
+# (buffer, offset, shape, strides) and reads the original data, so rows,
+# columns, diagonals, transposes, blocks and reshapes are O(1) to create and
+# never duplicate the matrix.
+#
+# - The buffer is any flat sequence: a list, an array.array or a memoryview.
+# - Element (i, j) lives at buffer[offset + i*row_stride + j*col_stride].
+# - Views behave like lists of lists, so print_matrix, sum_row, sum_column,
+#   sum_main_diagonal... work with them unchanged.
+
+class VectorView:
+    """
+    One-dimensional strided view: element k is buffer[offset + k*stride].
+    Used for rows, columns and diagonals.
+    """
+
+    def __init__(self, buffer, offset, length, stride=1):
+        self.buffer = buffer
+        self.offset = offset
+        self.length = length
+        self.stride = stride
+
+    def __len__(self):
+        return self.length
+
+    def _position(self, k):
+        """Position in the buffer of element k (accepts negative k)."""
+        if k < 0:
+            k += self.length
+        if not 0 <= k < self.length:
+            raise IndexError("view index out of range")
+        return self.offset + k * self.stride
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            # Slicing a view gives another view (no copy)
+            start, _, step = k.indices(self.length)
+            count = len(range(*k.indices(self.length)))
+            return VectorView(self.buffer, self.offset + start * self.stride,
+                              count, self.stride * step)
+        return self.buffer[self._position(k)]
+
+    def __setitem__(self, k, value):
+        self.buffer[self._position(k)] = value
+
+    def __iter__(self):
+        buffer, stride = self.buffer, self.stride
+        position = self.offset
+        for _ in range(self.length):
+            yield buffer[position]
+            position += stride
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"VectorView({self.tolist()})"
+
+    def tolist(self):
+        """Copies the viewed values into a new list."""
+        return list(self)
+
+    def as_memoryview(self):
+        """
+        memoryview over the same memory (array.array/bytearray buffers only).
+        - Strided memoryview slicing is zero-copy as well.
+        """
+        if self.length <= 1:
+            # The stride doesn't matter (and may be 0, e.g. the secondary
+            # diagonal of a single column)
+            return memoryview(self.buffer)[self.offset:self.offset + self.length]
+        if self.stride == 0:
+            raise ValueError("memoryview cannot repeat an element (stride 0)")
+        last = self.offset + (self.length - 1) * self.stride
+        if self.stride > 0:
+            return memoryview(self.buffer)[self.offset:last + 1:self.stride]
+        # Negative stride: 'last' is the lowest position (None = go down to 0)
+        end = last - 1 if last > 0 else None
+        return memoryview(self.buffer)[self.offset:end:self.stride]
+
+
+class MatrixView:
+    """
+    Two-dimensional strided view over a flat buffer.
+
+    - MatrixView(numbers, 3, 3) reads the list 'numbers' as a 3x3 matrix.
+    - view[i] is row i (a VectorView) and view[i, j] a single element.
+    - row, column, diagonal, transpose, block and reshape are O(1).
+    - Writing through a view writes into the shared buffer.
+    """
+
+    def __init__(self, buffer, rows, columns, offset=0, row_stride=None, col_stride=1):
+        if row_stride is None:
+            row_stride = columns * col_stride  # Contiguous row-major layout
+        self.buffer = buffer
+        self.rows = rows
+        self.columns = columns
+        self.offset = offset
+        self.row_stride = row_stride
+        self.col_stride = col_stride
+
+    @classmethod
+    def from_rows(cls, matrix, typecode=None):
+        """
+        Copies a list of lists ONCE into a flat buffer and returns its view.
+        - typecode (e.g. 'q' or 'd') stores the values in an array.array,
+          which uses far less memory than a list and supports memoryview.
+        """
+        rows = len(matrix)
+        columns = len(matrix[0]) if rows else 0
+        if any(len(row) != columns for row in matrix):
+            raise ValueError("all rows must have the same length")
+        flat = (elem for row in matrix for elem in row)
+        buffer = array.array(typecode, flat) if typecode else list(flat)
+        return cls(buffer, rows, columns)
+
+    @property
+    def shape(self):
+        return self.rows, self.columns
+
+    def __len__(self):
+        return self.rows
+
+    def _position(self, i, j):
+        if i < 0:
+            i += self.rows
+        if j < 0:
+            j += self.columns
+        if not (0 <= i < self.rows and 0 <= j < self.columns):
+            raise IndexError("view index out of range")
+        return self.offset + i * self.row_stride + j * self.col_stride
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            return self.buffer[self._position(*index)]
+        return self.row(index)
+
+    def __setitem__(self, index, value):
+        if not isinstance(index, tuple):
+            raise TypeError("use view[i, j] = value to write an element")
+        self.buffer[self._position(*index)] = value
+
+    def __iter__(self):
+        for i in range(self.rows):
+            yield self.row(i)
+
+    def __repr__(self):
+        return f"MatrixView({self.tolist()})"
+
+    def row(self, i):
+        """Row i as a VectorView."""
+        if i < 0:
+            i += self.rows
+        if not 0 <= i < self.rows:
+            raise IndexError("row index out of range")
+        return VectorView(self.buffer, self.offset + i * self.row_stride,
+                          self.columns, self.col_stride)
+
+    def column(self, j):
+        """Column j as a VectorView (no need to visit every row list)."""
+        if j < 0:
+            j += self.columns
+        if not 0 <= j < self.columns:
+            raise IndexError("column index out of range")
+        return VectorView(self.buffer, self.offset + j * self.col_stride,
+                          self.rows, self.row_stride)
+
+    def diagonal(self):
+        """Main diagonal ([0,0], [1,1], ...) as a VectorView."""
+        length = min(self.rows, self.columns)
+        return VectorView(self.buffer, self.offset, length,
+                          self.row_stride + self.col_stride)
+
+    def secondary_diagonal(self):
+        """Secondary diagonal ([0,n-1], [1,n-2], ...) as a VectorView."""
+        length = min(self.rows, self.columns)
+        start = self.offset + (self.columns - 1) * self.col_stride
+        return VectorView(self.buffer, start, length,
+                          self.row_stride - self.col_stride)
+
+    def transpose(self):
+        """Transposed view: swaps shape and strides, copies nothing."""
+        return MatrixView(self.buffer, self.columns, self.rows, self.offset,
+                          self.col_stride, self.row_stride)
+
+    def block(self, row, column, rows, columns):
+        """Rectangular block of size rows x columns starting at (row, column)."""
+        if rows < 0 or columns < 0 or row < 0 or column < 0 \
+                or row + rows > self.rows or column + columns > self.columns:
+            raise IndexError("block out of range")
+        return MatrixView(self.buffer, rows, columns,
+                          self.offset + row * self.row_stride + column * self.col_stride,
+                          self.row_stride, self.col_stride)
+
+    def is_contiguous(self):
+        """True if the elements are consecutive in the buffer in row-major order."""
+        return self.col_stride == 1 and (self.row_stride == self.columns or self.rows <= 1)
+
+    def reshape(self, rows, columns):
+        """
+        Same elements read with another shape (row-major order).
+        - O(1) for contiguous views; otherwise use tolist() and reshape the copy.
+        """
+        if rows * columns != self.rows * self.columns:
+            raise ValueError(f"cannot reshape {self.rows}x{self.columns} into {rows}x{columns}")
+        if not self.is_contiguous():
+            raise ValueError("reshape without copy needs a contiguous view")
+        return MatrixView(self.buffer, rows, columns, self.offset)
+
+    def tolist(self):
+        """Copies the viewed values into a new list of lists."""
+        return [row.tolist() for row in self]
+
+    def as_memoryview(self):
+        """
+        2-D memoryview over the same memory (contiguous array-backed views).
+        - mv[i, j] reads elements; mv.tolist() gives the list of lists.
+        """
+        if not self.is_contiguous():
+            raise ValueError("memoryview needs a contiguous view")
+        flat = memoryview(self.buffer)[self.offset:self.offset + self.rows * self.columns]
+        return flat.cast("B").cast(flat.format, [self.rows, self.columns])
@@ -0,0 +1,160 @@
+import collections
+import itertools
+import operator
+
+from .utils import numpy_sum_dtype, optional_numpy
+
+# =========================
+# Sliding-window aggregation (box sums, moving averages, window max/min)
+# =========================
+# sum_row and matrix_average aggregate a whole row or the whole matrix. Here
+# the same is done for every height x width window that fits in the matrix
+# ("valid" windows: the result has rows-height+1 rows and
+# columns-width+1 columns), in O(rows * columns) whatever the window size:
+#
+# - Sums/averages: running sums. Every row is reduced to its width-wide
+#   window sums with prefix sums, then height consecutive reduced rows are
+#   added by sliding (add the row that enters, subtract the one that leaves).
+# - Max/min: monotonic deque over every row, then over every column of the
+#   row results. Each value enters and leaves the deque once.
+# - With NumPy installed the same passes run vectorized.
+# - SummedAreaTable answers the sum of ANY rectangle in O(1) after one pass.
+
+
+def _window_shape(matrix, height, width):
+    """Validates the window against the matrix; returns (rows, columns, width)."""
+    width = height if width is None else width
+    rows = len(matrix)
+    columns = len(matrix[0]) if rows else 0
+    if height < 1 or width < 1:
+        raise ValueError("the window must be at least 1x1")
+    if height > rows or width > columns:
+        raise ValueError(f"a {height}x{width} window does not fit in a {rows}x{columns} matrix")
+    if any(len(row) != columns for row in matrix):
+        raise ValueError("the matrix must be rectangular")
+    return rows, columns, width
+
+
+def _row_window_sums(row, width):
+    """Sums of every width consecutive values of row (prefix sums)."""
+    prefix = [0, *itertools.accumulate(row)]
+    return list(map(operator.sub, prefix[width:], prefix))
+
+
+def sliding_sums(matrix, height, width=None, use_numpy=None):
+    """
+    Box sums: result[i][j] is the sum of the height x width window whose
+    top-left cell is (i, j). width defaults to height (square windows).
+    """
+    rows, columns, width = _window_shape(matrix, height, width)
+    np = optional_numpy(use_numpy)
+    if np is not None:
+        values = np.asarray(matrix)
+        dtype = numpy_sum_dtype(np, values)
+        if dtype is object:
+            values = values.astype(object)  # Exact Python ints
+        table = np.zeros((rows + 1, columns + 1), dtype=dtype)
+        table[1:, 1:] = values.cumsum(axis=0, dtype=dtype).cumsum(axis=1, dtype=dtype)
+        sums = (table[height:, width:] - table[:-height, width:]
+                - table[height:, :-width] + table[:-height, :-width])
+        return sums.tolist()
+
+    reduced = [_row_window_sums(row, width) for row in matrix]
+    # Running vertical sum of height reduced rows (map() adds lists in C)
+    current = reduced[0]
+    for row in reduced[1:height]:
+        current = list(map(operator.add, current, row))
+    result = [current]
+    for leaving, entering in zip(reduced, reduced[height:]):
+        current = list(map(operator.sub, map(operator.add, current, entering), leaving))
+        result.append(current)
+    return result
+
+
+def sliding_averages(matrix, height, width=None, use_numpy=None):
+    """Moving averages: the sliding sums divided by the window size."""
+    width = height if width is None else width
+    cells = height * width
+    return [[total / cells for total in row]
+            for row in sliding_sums(matrix, height, width, use_numpy)]
+
+
+def _sliding_extreme(values, size, better):
+    """
+    Max (better=operator.gt) or min (operator.lt) of every size consecutive
+    values, with a deque of candidate indices whose values go from best to worst.
+    """
+    candidates = collections.deque()
+    result = []
+    for index, value in enumerate(values):
+        # Candidates that are not better than the new value can never win again
+        while candidates and not better(values[candidates[-1]], value):
+            candidates.pop()
+        candidates.append(index)
+        if candidates[0] <= index - size:
+            candidates.popleft()  # Left the window
+        if index >= size - 1:
+            result.append(values[candidates[0]])
+    return result
+
+
+def _sliding_extremes(matrix, height, width, use_numpy, better, reduce_name):
+    _, _, width = _window_shape(matrix, height, width)
+    np = optional_numpy(use_numpy)
+    if np is not None:
+        windows = np.lib.stride_tricks.sliding_window_view
+        reduce = getattr(np, reduce_name)
+        # Separable: reduce along the rows first, then along the columns
+        partial = reduce(windows(np.asarray(matrix), width, axis=1), axis=-1)
+        return reduce(windows(partial, height, axis=0), axis=-1).tolist()
+
+    partial = [_sliding_extreme(row, width, better) for row in matrix]
+    columns_result = [_sliding_extreme(column, height, better) for column in zip(*partial)]
+    return [list(row) for row in zip(*columns_result)]
+
+
+def sliding_max(matrix, height, width=None, use_numpy=None):
+    """Window maxima: result[i][j] is the max of the window at (i, j)."""
+    return _sliding_extremes(matrix, height, width, use_numpy, operator.gt, "max")
+
+
+def sliding_min(matrix, height, width=None, use_numpy=None):
+    """Window minima: result[i][j] is the min of the window at (i, j)."""
+    return _sliding_extremes(matrix, height, width, use_numpy, operator.lt, "min")
+
+
+class SummedAreaTable:
+    """
+    Summed-area table (integral image) of a matrix.
+
+    - table[i][j] is the sum of the rows [0, i) x columns [0, j) rectangle.
+    - region_sum / region_average of any rectangle in O(1), half-open like
+      Python slices: rows [top, bottom) and columns [left, right).
+    """
+
+    def __init__(self, matrix):
+        self.rows = len(matrix)
+        self.columns = len(matrix[0]) if self.rows else 0
+        previous = [0] * (self.columns + 1)
+        self.table = [previous]
+        for row in matrix:
+            if len(row) != self.columns:
+                raise ValueError("the matrix must be rectangular")
+            previous = list(map(operator.add, previous, [0, *itertools.accumulate(row)]))
+            self.table.append(previous)
+
+    def region_sum(self, top=0, bottom=None, left=0, right=None):
+        bottom = self.rows if bottom is None else bottom
+        right = self.columns if right is None else right
+        if not (0 <= top <= bottom <= self.rows and 0 <= left <= right <= self.columns):
+            raise ValueError("the region must be inside the matrix")
+        table = self.table
+        return (table[bottom][right] - table[top][right]
+                - table[bottom][left] + table[top][left])
+
+    def region_average(self, top=0, bottom=None, left=0, right=None):
+        bottom = self.rows if bottom is None else bottom
+        right = self.columns if right is None else right
+        cells = (bottom - top) * (right - left)
+        total = self.region_sum(top, bottom, left, right)
+        return total / cells if cells > 0 else 0